@@ -1,36 +1,234 @@
 # data_loader.py
+import functools
+import logging
+import os
+import random
+import re
+import tempfile
+import time
+import requests_cache
 import yfinance as yf
 import pandas as pd
+import streamlit as st
+from streamlit.connections import BaseConnection
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from yfinance.exceptions import YFRateLimitError
+
+logger = logging.getLogger(__name__)
+
+# Yahoo throttles bursts of requests; transient 429/5xx answers are retried
+# with exponential backoff instead of failing the section outright.
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=1.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
+
+def mount_retries(session, retry=HTTP_RETRY):
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def retry_on_rate_limit(func):
+    """
+    Retries a yfinance call once after a randomized 3-5 s pause when Yahoo
+    rate-limits it. yfinance manages its own session, so this cannot be done
+    with an adapter.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except YFRateLimitError:
+            time.sleep(random.uniform(3, 5))
+            return func(*args, **kwargs)
+    return wrapper
+
+# One shared yf.Ticker per symbol so every fetch reuses the same object and
+# HTTP session. It expires with the data caches below, because a Ticker
+# memoizes .info and the statements for its whole lifetime.
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_ticker(symbol):
+    return yf.Ticker(symbol)
+
+# --- Direct quoteSummary access ---
+# yfinance's .info downloads every quoteSummary module; these five hold all
+# the scalar fields the dashboard actually reads.
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{}"
+QUOTE_SUMMARY_MODULES = "summaryProfile,summaryDetail,defaultKeyStatistics,financialData,price"
+
+class YFinanceConnection(BaseConnection[requests_cache.CachedSession]):
+    """
+    st.connection wrapper around a Yahoo Finance session. The session, its
+    cookie and the matching crumb are created once and reused across reruns
+    and sessions instead of repeating the handshake for every lookup.
+    """
+
+    def _connect(self, **kwargs):
+        # Responses are persisted to SQLite so a server restart doesn't mean a
+        # cold fetch. The handshake endpoints must never be served from cache,
+        # and the crumb is left out of the cache key because it changes per
+        # session.
+        session = requests_cache.CachedSession(
+            kwargs.get("cache_name", "yahoo_cache"),
+            backend="sqlite",
+            expire_after=3600,
+            urls_expire_after={
+                "fc.yahoo.com": requests_cache.DO_NOT_CACHE,
+                "*/v1/test/getcrumb": requests_cache.DO_NOT_CACHE,
+                # quoteSummary carries market cap / P/E, so match the info TTL
+                "*/quoteSummary/*": 300,
+            },
+            ignored_parameters=["crumb"],
+        )
+        session.headers.update({"User-Agent": "Mozilla/5.0"})
+        mount_retries(session)
+        # Yahoo ties the crumb to the cookie set by fc.yahoo.com, so both must
+        # come from the same session. fc.yahoo.com answers 404 but still sets
+        # the cookie we need.
+        session.get("https://fc.yahoo.com", timeout=10)
+        crumb = session.get("https://query2.finance.yahoo.com/v1/test/getcrumb", timeout=10).text
+        if not crumb or "<" in crumb:
+            raise ValueError("Yahoo did not return a crumb")
+        self._crumb = crumb
+        return session
+
+    def quote_summary(self, symbol):
+        """
+        Fetches only the profile/valuation modules from Yahoo's quoteSummary
+        endpoint and flattens them into one dict keyed like yfinance's .info.
+        """
+        session = self._instance
+        response = session.get(
+            QUOTE_SUMMARY_URL.format(symbol),
+            params={"modules": QUOTE_SUMMARY_MODULES, "crumb": self._crumb, "formatted": "false"},
+            timeout=10,
+        )
+        if response.status_code == 401:
+            # Crumb expired; the next call reconnects and fetches a fresh one
+            self.reset()
+        response.raise_for_status()
+
+        info = {}
+        for module in response.json()["quoteSummary"]["result"][0].values():
+            if isinstance(module, dict):
+                info.update(module)
+        return info
+
+def yahoo_connection():
+    return st.connection("yfinance", type=YFinanceConnection)
+
+def fetch_quote_summary(ticker):
+    return yahoo_connection().quote_summary(ticker)
+
+# Local copies of the price histories so a server restart (or a cold
+# process) doesn't mean a fresh yfinance download for every ticker.
+PRICE_CACHE_DIR = "price_cache"
+PRICE_CACHE_MAX_AGE = 3600
+# Ticker text comes straight from the sidebar, so only plain symbols
+# (AAPL, RELIANCE.NS, ^GSPC, EURUSD=X, BRK-B) are allowed into a filename.
+_CACHE_KEY_RE = re.compile(r"[A-Z0-9.^=-]+")
+
+def _price_cache_path(ticker, period):
+    """Returns the parquet path for a history, or None if the key isn't filename-safe."""
+    for part in (ticker, period):
+        if not _CACHE_KEY_RE.fullmatch(part.upper()) or set(part) == {"."}:
+            return None
+    return os.path.join(PRICE_CACHE_DIR, f"{ticker}_{period}.parquet")
+
+def _read_price_cache(cache_file):
+    try:
+        if time.time() - os.path.getmtime(cache_file) < PRICE_CACHE_MAX_AGE:
+            return pd.read_parquet(cache_file)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        # Truncated or corrupt file (pyarrow raises ArrowInvalid, a ValueError);
+        # drop it so the fresh download can replace it.
+        try:
+            os.remove(cache_file)
+        except OSError:
+            pass
+    return None
+
+def _write_price_cache(cache_file, df):
+    try:
+        os.makedirs(PRICE_CACHE_DIR, exist_ok=True)
+        # Expired histories are never read again, so clear them out here
+        now = time.time()
+        for entry in os.scandir(PRICE_CACHE_DIR):
+            if entry.name.endswith(".parquet") and now - entry.stat().st_mtime > PRICE_CACHE_MAX_AGE:
+                os.remove(entry.path)
+
+        # Write to a temp file and swap it in, so a concurrent reader or a
+        # crash mid-write never sees a half-written parquet file.
+        fd, tmp_path = tempfile.mkstemp(dir=PRICE_CACHE_DIR, suffix=".parquet.tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except (OSError, ValueError):
+        pass
+
+# Streamlit re-runs the whole script on every widget interaction, so cache
+# network results for an hour instead of re-downloading on each rerun.
+# The cached helpers raise on failure so errors are never cached; the public
+# functions below are the error boundary and turn failures into None.
+@st.cache_data(ttl=3600, show_spinner=False)
+@retry_on_rate_limit
+def _download_history(ticker, period):
+    cache_file = _price_cache_path(ticker, period)
+    if cache_file is not None:
+        cached = _read_price_cache(cache_file)
+        if cached is not None:
+            return cached
+
+    # Using yfinance to download data
+    stock = get_ticker(ticker)
+    df = stock.history(period=period)
+
+    if df.empty:
+        return None
+
+    # Reset index to make Date a column for easier plotting later
+    df.reset_index(inplace=True)
+
+    # Standardize timezone to remove potential issues with plotting.
+    # Stripping the tz keeps a vectorized datetime64 column instead of
+    # Python date objects.
+    if df['Date'].dt.tz is not None:
+        df['Date'] = df['Date'].dt.tz_localize(None)
+
+    if cache_file is not None:
+        _write_price_cache(cache_file, df)
+    return df
+
+@st.cache_data(ttl=3600, show_spinner=False)
+@retry_on_rate_limit
+def _download_info(ticker):
+    return get_ticker(ticker).info
 
 def fetch_stock_data(ticker, period="5y"):
     """
     Fetches historical stock data for a given ticker.
-    
+
     Args:
         ticker (str): The stock symbol (e.g., 'AAPL').
         period (str): The duration of data to fetch (default '5y' per REQ-3.4.1-1).
-        
+
     Returns:
         pd.DataFrame: A dataframe containing Open, High, Low, Close, Volume.
     """
     try:
-        # Using yfinance to download data
-        stock = yf.Ticker(ticker)
-        df = stock.history(period=period)
-        
-        if df.empty:
-            return None
-        
-        # Reset index to make Date a column for easier plotting later
-        df.reset_index(inplace=True)
-        
-        # Standardize timezone to remove potential issues with plotting
-        df['Date'] = df['Date'].dt.date
-        
-        return df
-        
+        return _download_history(ticker, period)
     except Exception as e:
-        print(f"Error fetching data: {e}")
+        logger.warning("Error fetching data for %s: %s", ticker, e)
         return None
 
 def get_company_info(ticker):
@@ -38,7 +236,7 @@ def get_company_info(ticker):
     Fetches basic company metadata (Sector, Description).
     """
     try:
-        stock = yf.Ticker(ticker)
-        return stock.info
-    except:
-        return None
\ No newline at end of file
+        return _download_info(ticker)
+    except Exception as e:
+        logger.warning("Error fetching company info for %s: %s", ticker, e)
+        return None
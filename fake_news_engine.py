@@ -1,42 +1,83 @@
+import threading
+import numpy as np
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import streamlit as st
 import torch.nn.functional as F
 
+# Headlines are well under 64 tokens. Inputs are padded to exactly this
+# length because the TorchScript graph is traced with fixed shapes.
+MAX_HEADLINE_TOKENS = 64
+
+# torch.set_num_threads is process-wide and detect_fake_news runs on several
+# news workers at once; without this, one call could save another's capped
+# value and "restore" it for good.
+_THREADS_LOCK = threading.Lock()
+
+def tokenize_headlines(tokenizer, texts):
+    return tokenizer(texts, return_tensors="pt", padding="max_length", truncation=True, max_length=MAX_HEADLINE_TOKENS)
+
 # Load a Pre-trained Fake News Detection Model
 # We use 'mrm8488/bert-tiny-finetuned-fake-news-detection' 
 # It is fast, lightweight, and accurate for this purpose.
 @st.cache_resource
 def load_fake_news_model():
     model_name = "mrm8488/bert-tiny-finetuned-fake-news-detection"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
     model = AutoModelForSequenceClassification.from_pretrained(model_name)
-    return tokenizer, model
+    # Plain tuple outputs (instead of a ModelOutput dict) so the model can be traced
+    model.config.return_dict = False
+    
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        model = model.to(device).half()
+    else:
+        device = torch.device("cpu")
+        # Dynamic int8 quantization of the Linear layers: no retraining needed,
+        # ~4x smaller weights and faster CPU matmuls for this bandwidth-bound model.
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    model.eval()
+    
+    # Trace once into a frozen TorchScript graph so each call skips eager-mode
+    # module dispatch and gets the JIT's op fusions.
+    example = tokenize_headlines(tokenizer, ["Example headline"]).to(device)
+    with torch.no_grad():
+        model = torch.jit.freeze(torch.jit.trace(model, (example['input_ids'], example['attention_mask'])))
+    return tokenizer, model, device
 
-def detect_fake_news(text):
+def detect_fake_news(texts):
     """
-    Analyzes a headline and returns:
+    Analyzes a batch of headlines in a single forward pass and returns
+    one (label, confidence) pair per headline:
     - Label: 'REAL' or 'FAKE'
     - Confidence: Score (0.0 to 1.0)
     """
-    tokenizer, model = load_fake_news_model()
+    tokenizer, model, device = load_fake_news_model()
     
     # 1. Prepare text
-    inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+    inputs = tokenize_headlines(tokenizer, texts).to(device)
     
     # 2. Predict
-    with torch.no_grad():
-        outputs = model(**inputs)
+    # BERT-tiny is too small to use every core; extra threads only add
+    # per-call scheduling overhead. The cap is restored afterwards so
+    # FinBERT and the forecast model keep the full thread pool.
+    with _THREADS_LOCK:
+        num_threads = torch.get_num_threads()
+        torch.set_num_threads(min(4, num_threads))
+        try:
+            with torch.inference_mode():
+                logits = model(inputs['input_ids'], inputs['attention_mask'])[0]
+        finally:
+            torch.set_num_threads(num_threads)
     
     # 3. Get Probabilities
-    probs = F.softmax(outputs.logits, dim=1)
+    probs = F.softmax(logits.float(), dim=1).cpu().numpy()
     
     # The model classes are usually [0: Fake, 1: Real] (Check model card if unsure)
     # For this specific model: Index 1 is Real, Index 0 is Fake
-    fake_prob = probs[0][0].item()
-    real_prob = probs[0][1].item()
+    fake_prob = probs[:, 0]
+    real_prob = probs[:, 1]
     
-    if real_prob > fake_prob:
-        return "REAL", real_prob
-    else:
-        return "FAKE", fake_prob
\ No newline at end of file
+    labels = np.where(real_prob > fake_prob, "REAL", "FAKE")
+    confidences = np.maximum(real_prob, fake_prob)
+    return list(zip(labels.tolist(), confidences.tolist()))
@@ -1,36 +1,141 @@
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
-def add_technical_indicators(df):
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the kernel below runs as plain Python: same results,
+    # just slower
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+RSI_LENGTH = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BB_LENGTH, BB_STD = 20, 2.0
+
+MACD_COLUMNS = ['MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9']
+BBANDS_COLUMNS = ['LowerBand', 'MidBand', 'UpperBand', 'Bandwidth', 'Percent']
+
+@njit(cache=True)
+def compute_indicators(close):
+    """
+    Single fused pass over the Close prices.
+    Returns RSI, MACD (line, histogram, signal) and Bollinger Bands
+    (lower, mid, upper, bandwidth, percent) as float64 arrays.
+    Warm-up rows are NaN, matching the pandas_ta conventions.
+    """
+    n = close.shape[0]
+    out = np.full((9, n), np.nan)
+
+    fast_alpha = 2.0 / (MACD_FAST + 1)
+    slow_alpha = 2.0 / (MACD_SLOW + 1)
+    signal_alpha = 2.0 / (MACD_SIGNAL + 1)
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    fast_ema = 0.0
+    slow_ema = 0.0
+    signal_ema = 0.0
+    macd_sum = 0.0
+    win_sum = 0.0
+    win_sq = 0.0
+
+    for i in range(n):
+        price = close[i]
+
+        # 1. RSI (Wilder's smoothing, seeded with a simple average)
+        if i > 0:
+            change = price - close[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if i <= RSI_LENGTH:
+                avg_gain += gain / RSI_LENGTH
+                avg_loss += loss / RSI_LENGTH
+            else:
+                avg_gain = (avg_gain * (RSI_LENGTH - 1) + gain) / RSI_LENGTH
+                avg_loss = (avg_loss * (RSI_LENGTH - 1) + loss) / RSI_LENGTH
+            if i >= RSI_LENGTH:
+                total = avg_gain + avg_loss
+                out[0, i] = 100.0 * avg_gain / total if total > 0 else 50.0
+
+        # 2. MACD (EMAs seeded with the SMA of their first window)
+        if i < MACD_FAST:
+            fast_ema += price / MACD_FAST
+        else:
+            fast_ema += fast_alpha * (price - fast_ema)
+        if i < MACD_SLOW:
+            slow_ema += price / MACD_SLOW
+        else:
+            slow_ema += slow_alpha * (price - slow_ema)
+
+        if i >= MACD_SLOW - 1:
+            macd = fast_ema - slow_ema
+            out[1, i] = macd
+            k = i - (MACD_SLOW - 1)
+            if k < MACD_SIGNAL:
+                macd_sum += macd
+                if k == MACD_SIGNAL - 1:
+                    signal_ema = macd_sum / MACD_SIGNAL
+            else:
+                signal_ema += signal_alpha * (macd - signal_ema)
+            if k >= MACD_SIGNAL - 1:
+                out[3, i] = signal_ema
+                out[2, i] = macd - signal_ema
+
+        # 3. Bollinger Bands (running sum / sum-of-squares window)
+        win_sum += price
+        win_sq += price * price
+        if i >= BB_LENGTH:
+            old = close[i - BB_LENGTH]
+            win_sum -= old
+            win_sq -= old * old
+        if i >= BB_LENGTH - 1:
+            mid = win_sum / BB_LENGTH
+            var = win_sq / BB_LENGTH - mid * mid
+            std = np.sqrt(var) if var > 0 else 0.0
+            lower = mid - BB_STD * std
+            upper = mid + BB_STD * std
+            out[4, i] = lower
+            out[5, i] = mid
+            out[6, i] = upper
+            if mid != 0:
+                out[7, i] = 100.0 * (upper - lower) / mid
+            if upper != lower:
+                out[8, i] = (price - lower) / (upper - lower)
+
+    return out
+
+def add_technical_indicators(df, dropna=True):
     """
     REQ-3.4.2-1: Adds RSI, MACD, and Bollinger Bands.
+    Pass dropna=False to keep the warm-up rows (NaN indicators) for
+    charts that should render the full price history.
     """
     # Create a copy to avoid SettingWithCopy warnings
     df = df.copy()
-    
-    # Ensure date is sorted
-    df = df.sort_values(by="Date")
-    
+
+    # Ensure date is sorted (yfinance already returns chronological data,
+    # so only pay for the sort when it is actually needed)
+    if not df['Date'].is_monotonic_increasing:
+        df = df.sort_values(by="Date", kind="mergesort")
+
+    # All indicators come out of one compiled pass over the Close prices
+    close = df['Close'].to_numpy(dtype=np.float64)
+    indicators = compute_indicators(close)
+
     # 1. RSI (Relative Strength Index)
-    df['RSI'] = ta.rsi(df['Close'], length=14)
-    
-    # 2. MACD
-    macd = ta.macd(df['Close'], fast=12, slow=26, signal=9)
-    # MACD returns 3 columns. We merge them back.
-    df = pd.concat([df, macd], axis=1)
-    
-    # 3. Bollinger Bands
-    bbands = ta.bbands(df['Close'], length=20, std=2)
-    
-    # --- CRITICAL FIX: Rename columns to simple names ---
-    # pandas_ta returns columns like BBL_20_2.0. We rename them to be safe.
-    if bbands is not None:
-        # The columns are usually in order: Lower, Mid, Upper, Bandwidth, Percent
-        # We assume the default column order from pandas_ta
-        bbands.columns = ['LowerBand', 'MidBand', 'UpperBand', 'Bandwidth', 'Percent']
-        df = pd.concat([df, bbands], axis=1)
-    
-    # Cleanup: Drop NaN values (first 20 days will be empty due to moving averages)
-    df.dropna(inplace=True)
-    
-    return df
\ No newline at end of file
+    df['RSI'] = indicators[0]
+
+    # 2. MACD & 3. Bollinger Bands
+    # Assign straight into new columns rather than pd.concat, which would
+    # copy every existing block of the frame for each indicator group.
+    for row, col in enumerate(MACD_COLUMNS + BBANDS_COLUMNS, start=1):
+        df[col] = indicators[row]
+
+    # Cleanup: Drop NaN values (first 33 days will be empty due to moving averages)
+    if dropna:
+        df.dropna(inplace=True)
+
+    return df
@@ -1,32 +1,126 @@
-import yfinance as yf
+import logging
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import requests
 import streamlit as st
 import plotly.graph_objects as go
-from css_styling import load_fundamental_css
+from concurrent.futures import ThreadPoolExecutor
+from data_loader import fetch_quote_summary, get_ticker, retry_on_rate_limit
 
-def get_fundamental_data(ticker):
-    stock = yf.Ticker(ticker)
-    info = stock.info
+logger = logging.getLogger(__name__)
+
+# Each yfinance property is its own HTTP call, so cache them individually
+# (one pickleable object per entry) and assemble the dict afterwards.
+# .info carries price-derived fields (market cap, P/E) so it refreshes every
+# few minutes; statements, calendar and dividends change at most daily.
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_info(ticker):
+    try:
+        return fetch_quote_summary(ticker)
+    except Exception as e:
+        logger.warning("quoteSummary failed for %s, falling back to .info: %s", ticker, e)
+        return get_ticker(ticker).info
+
+@st.cache_data(ttl=86400, show_spinner=False)
+@retry_on_rate_limit
+def _cached_attr(ticker, attr):
+    return getattr(get_ticker(ticker), attr)
+
+def _logo_url(ticker, website):
+    if website and website != "N/A":
+        return f"https://t3.gstatic.com/faviconV2?client=SOCIAL&type=FAVICON&fallback_opts=TYPE,SIZE,URL&url={website}&size=256"
+    return f"https://ui-avatars.com/api/?name={ticker}&background=random&size=256&bold=true"
+
+# Raises on failure so a timeout or an HTML error page isn't cached for a day
+@st.cache_data(ttl=86400, show_spinner=False)
+def _download_logo(url):
+    response = requests.get(url, timeout=5)
+    response.raise_for_status()
+    if not response.headers.get("Content-Type", "").startswith("image/"):
+        raise ValueError(f"not an image: {response.headers.get('Content-Type')}")
+    return response.content
+
+def fetch_logo(url):
+    """
+    Downloads the logo once a day and returns its bytes (None on failure),
+    so reruns serve it from Streamlit's media cache instead of re-hitting
+    the favicon service.
+    """
+    try:
+        return _download_logo(url)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Logo fetch failed for %s: %s", url, e)
+        return None
+
+# Maps our dict keys to the yfinance properties that back them, plus the
+# empty value to fall back to if that one request fails
+STATEMENT_ATTRS = {
+    "income_stmt": ("financials", pd.DataFrame),
+    "balance_sheet": ("balance_sheet", pd.DataFrame),
+    "cash_flow": ("cashflow", pd.DataFrame),
+    "calendar": ("calendar", dict),
+    "dividends": ("dividends", pd.Series),
+}
+
+# Long-lived pool for the per-ticker fan-out, so a cache miss reuses warm
+# worker threads instead of spawning and joining a fresh pool every time.
+# The futures only wait on Yahoo, so a handful of threads covers several
+# tickers in flight.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=12, thread_name_prefix="yahoo-fetch")
+
+# Runs whole get_fundamental_data calls for the page header. Kept apart from
+# _FETCH_POOL: those calls wait on _FETCH_POOL futures themselves, and
+# submitting them there could tie up every worker waiting on its own queue.
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fundamentals")
+
+class _PartialFundamentalsError(Exception):
+    """
+    Raised from the cached lookup when some Yahoo requests failed, so the
+    gap isn't cached; .data holds the dict with empty defaults filled in.
+    """
+    def __init__(self, data, failed):
+        super().__init__(f"could not fetch {', '.join(failed)}")
+        self.data = data
+
+def _result_or_default(future, default, what, ticker, failed):
+    # One failing endpoint should leave an empty section, not kill the page
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning("Could not fetch %s for %s: %s", what, ticker, e)
+        failed.append(what)
+        return default()
+
+# Cached on the shortest inner TTL so reruns skip re-assembling the dict.
+# Concurrent cache misses for the same ticker are already coalesced:
+# st.cache_data holds a per-key compute lock, so only one session fetches
+# from Yahoo while the others wait for its result.
+@st.cache_data(ttl=300, show_spinner=False)
+def _download_fundamentals(ticker):
+    # Every property is an independent, I/O-bound request to Yahoo, so
+    # overlap them instead of paying one round-trip after another.
+    info_future = _FETCH_POOL.submit(_cached_info, ticker)
+    statement_futures = {
+        key: _FETCH_POOL.submit(_cached_attr, ticker, attr)
+        for key, (attr, _) in STATEMENT_ATTRS.items()
+    }
+    failed = []
+    info = _result_or_default(info_future, dict, "info", ticker, failed)
+    statements = {
+        key: _result_or_default(statement_futures[key], default, attr, ticker, failed)
+        for key, (attr, default) in STATEMENT_ATTRS.items()
+    }
     
     def safe_get(key, default="N/A"):
         return info.get(key, default)
 
     # --- High-Res Logo Logic ---
     website = safe_get("website")
-    logo_url = ""
-    
-    if website and website != "N/A":
-        logo_url = f"https://t3.gstatic.com/faviconV2?client=SOCIAL&type=FAVICON&fallback_opts=TYPE,SIZE,URL&url={website}&size=256"
-    else:
-        logo_url = f"https://ui-avatars.com/api/?name={ticker}&background=random&size=256&bold=true"
-
-    return {
-        "info": info,
-        "income_stmt": stock.financials,
-        "balance_sheet": stock.balance_sheet,
-        "cash_flow": stock.cashflow,
-        "calendar": stock.calendar,
-        "dividends": stock.dividends,
+    logo_url = _logo_url(ticker, website)
+
+    data = {
+        **statements,
         "name": safe_get("longName", ticker),
         "summary": safe_get("longBusinessSummary"),
         "sector": safe_get("sector"),
@@ -44,10 +138,164 @@ def get_fundamental_data(ticker):
         "debt_to_equity": safe_get("debtToEquity"),
         "eps": safe_get("trailingEps"),
     }
+    if failed:
+        raise _PartialFundamentalsError(data, failed)
+    return data
+
+def get_fundamental_data(ticker):
+    try:
+        return _download_fundamentals(ticker)
+    except _PartialFundamentalsError as e:
+        return e.data
+
+def submit_fundamental_data(ticker):
+    """
+    Starts get_fundamental_data in the background and returns its Future,
+    so the caller can load other data while Yahoo answers.
+    """
+    return _BACKGROUND_POOL.submit(get_fundamental_data, ticker)
+
+# Helper to format large numbers: bucket every value at once against the
+# M/B/T thresholds instead of branching per number
+_LARGE_THRESHOLDS = np.array([1e6, 1e9, 1e12])
+_LARGE_DIVISORS = np.array([1.0, 1e6, 1e9, 1e12])
+_LARGE_SUFFIXES = np.array(["", "M", "B", "T"])
+
+def format_large_vec(nums):
+    """
+    Formats a list of numbers as e.g. '2.50T', '830.12M', '24.31'.
+    Missing values ("N/A", None, NaN, non-numbers) come back as "N/A".
+    """
+    values = np.array(
+        [n if isinstance(n, (int, float)) and not isinstance(n, bool) else np.nan for n in nums],
+        dtype=float,
+    )
+    valid = ~np.isnan(values)
+    idx = np.searchsorted(_LARGE_THRESHOLDS, np.abs(np.where(valid, values, 0.0)))
+    scaled = values / _LARGE_DIVISORS[idx]
+    return [
+        f"{value:.2f}{suffix}" if ok else "N/A"
+        for value, suffix, ok in zip(scaled, _LARGE_SUFFIXES[idx], valid)
+    ]
+
+def format_calendar_value(value):
+    # yfinance gives some events as lists of dates (e.g. an earnings window)
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+# Streamlit ships the whole frame to the browser as Arrow, so cap how many
+# line items we send; the table only shows a screenful at a time anyway.
+MAX_STATEMENT_ROWS = 50
+
+def show_statement(df, height):
+    st.dataframe(df.iloc[:MAX_STATEMENT_ROWS], height=height, use_container_width=True)
+    if len(df) > MAX_STATEMENT_ROWS:
+        st.caption(f"Showing the first {MAX_STATEMENT_ROWS} of {len(df)} line items.")
+
+# (data key, label, kind) for each KPI card, two cards per grid column
+KPI_SPEC = (
+    ("market_cap", "📈 Market Cap", "currency"),
+    ("forward_pe", "📊 Forward P/E", "number"),
+    ("eps", "💰 EPS (TTM)", "currency"),
+    ("peg_ratio", "📈 PEG Ratio", "number"),
+    ("roe", "💹 ROE", "percent"),
+    ("roa", "📊 ROA", "percent"),
+    ("debt_to_equity", "⚖️ D/E Ratio", "number"),
+    ("price_to_book", "📕 P/B Ratio", "number"),
+)
+
+# Static HTML scaffold for the KPI grid; only labels and values vary. The
+# cards are kept on one line because a blank line would end the HTML block.
+KPI_TEMPLATE = '<div class="fund-metric"><div class="fund-label">%s</div><div class="fund-value">%%s</div></div>'
+# Labels never change, so each card's HTML is pre-rendered once with only a
+# slot left for its value
+KPI_CARDS = tuple(KPI_TEMPLATE % label for _, label, _ in KPI_SPEC)
+KPI_GRID_TEMPLATE = '<div class="fund-grid">%s</div>'
+
+# Chart layouts are identical on every render, so build them once
+INCOME_LAYOUT = dict(
+    barmode='group', 
+    height=400, 
+    paper_bgcolor='rgba(0,0,0,0)', 
+    plot_bgcolor='rgba(10, 14, 39, 0.5)',
+    font=dict(color='#e0e0e0'),
+    xaxis_title='Fiscal Year',
+    yaxis_title='Amount (USD)',
+    hovermode='x unified',
+    legend=dict(bgcolor='rgba(0,0,0,0.5)', bordercolor='#00B4D8', borderwidth=1),
+    uirevision='fund'
+)
+
+DIVIDEND_LAYOUT = dict(
+    height=300,
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(10, 14, 39, 0.5)',
+    font=dict(color='#e0e0e0'),
+    xaxis_title='Date',
+    yaxis_title='Dividend Amount',
+    hovermode='x unified'
+)
+
+# Figures are rebuilt only when the underlying data changes, not on every rerun
+@st.cache_data(show_spinner=False)
+def build_income_figure(income_stmt):
+    # Read the two rows straight out of the 5 most recent year columns;
+    # nothing is transposed or copied beyond those values.
+    years = income_stmt.columns[:5]
+    zeros = np.zeros(len(years))
+    revenue = income_stmt.loc['Total Revenue', years].to_numpy(dtype='float64') if 'Total Revenue' in income_stmt.index else zeros
+    net_income = income_stmt.loc['Net Income', years].to_numpy(dtype='float64') if 'Net Income' in income_stmt.index else zeros
+
+    # Create revenue and net income visualization (both bars share one x array)
+    x = years.to_numpy()
+    fig = go.Figure()
+    fig.add_bar(
+        name='Total Revenue', 
+        x=x, 
+        y=revenue,
+        marker=dict(color='rgba(0, 180, 216, 0.8)', line=dict(color='#00B4D8', width=1))
+    )
+    fig.add_bar(
+        name='Net Income', 
+        x=x, 
+        y=net_income,
+        marker=dict(color='rgba(0, 250, 154, 0.8)', line=dict(color='#00FA9A', width=1))
+    )
+    fig.update_layout(**INCOME_LAYOUT)
+    return fig
+
+# Beyond this many payments the SVG bars get heavy in the browser, so the
+# history is drawn as a WebGL line instead (Plotly has no WebGL bar trace)
+DIVIDEND_WEBGL_THRESHOLD = 200
+
+@st.cache_data(show_spinner=False)
+def build_dividend_figure(dividends):
+    # Plain numpy arrays skip Plotly's slower normalization path for pandas inputs
+    x = dividends.index.to_numpy()
+    y = dividends.to_numpy(dtype='float64')
+    fig_div = go.Figure()
+    if len(y) > DIVIDEND_WEBGL_THRESHOLD:
+        fig_div.add_trace(go.Scattergl(
+            x=x,
+            y=y,
+            mode='lines+markers',
+            line=dict(color='#00FA9A', width=1),
+            marker=dict(color='#00FA9A', size=4),
+            name='Dividend'
+        ))
+    else:
+        fig_div.add_trace(go.Bar(
+            x=x,
+            y=y,
+            marker=dict(color='#00FA9A', line=dict(color='#00B4D8', width=1)),
+            name='Dividend'
+        ))
+    fig_div.update_layout(**DIVIDEND_LAYOUT)
+    return fig_div
 
 def display_fundamentals(ticker):
     try:
-        load_fundamental_css()
         data = get_fundamental_data(ticker)
         currency_symbol = "₹" if ticker.endswith(".NS") or ticker.endswith(".BO") else "$"
 
@@ -65,169 +313,74 @@ def display_fundamentals(ticker):
         # --- Key Financial Metrics Section ---
         st.markdown('<div class="section-header">📊 Key Financial Metrics</div>', unsafe_allow_html=True)
 
-        kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-        
-        # Helper to format large numbers
-        def format_large(num):
-            if num == "N/A" or num is None: 
-                return "N/A"
-            if isinstance(num, (int, float)):
-                if num > 1e12: 
-                    return f"{num/1e12:.2f}T"
-                if num > 1e9: 
-                    return f"{num/1e9:.2f}B"
-                if num > 1e6: 
-                    return f"{num/1e6:.2f}M"
-                return f"{num:.2f}"
-            return str(num)
-
-        # Market Cap
-        with kpi1:
-            st.markdown("""
-            <div class="fund-metric">
-                <div class="fund-label">📈 Market Cap</div>
-                <div class="fund-value">%s</div>
-            </div>
-            """ % f"{currency_symbol}{format_large(data['market_cap'])}", unsafe_allow_html=True)
-        
-        # Forward P/E
-        with kpi1:
-            forward_pe = data['forward_pe'] if data['forward_pe'] != "N/A" else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">📊 Forward P/E</div>
-                <div class="fund-value">{forward_pe}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # EPS
-        with kpi2:
-            eps_val = f"{currency_symbol}{data['eps']}" if data['eps'] != "N/A" else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">💰 EPS (TTM)</div>
-                <div class="fund-value">{eps_val}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # PEG Ratio
-        with kpi2:
-            peg = data['peg_ratio'] if data['peg_ratio'] != "N/A" else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">📈 PEG Ratio</div>
-                <div class="fund-value">{peg}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # ROE
-        with kpi3:
-            roe_val = f"{data['roe']*100:.2f}%" if data['roe'] != "N/A" and data['roe'] is not None else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">💹 ROE</div>
-                <div class="fund-value">{roe_val}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # ROA
-        with kpi3:
-            roa_val = f"{data['roa']*100:.2f}%" if data['roa'] != "N/A" and data['roa'] is not None else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">📊 ROA</div>
-                <div class="fund-value">{roa_val}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Debt-to-Equity
-        with kpi4:
-            dte = data['debt_to_equity'] if data['debt_to_equity'] != "N/A" else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">⚖️ D/E Ratio</div>
-                <div class="fund-value">{dte}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # P/B Ratio
-        with kpi4:
-            pb = data['price_to_book'] if data['price_to_book'] != "N/A" else "N/A"
-            st.markdown(f"""
-            <div class="fund-metric">
-                <div class="fund-label">📕 P/B Ratio</div>
-                <div class="fund-value">{pb}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Percentages are scaled first so every KPI goes through one
+        # vectorized format pass; missing values come back as "N/A"
+        raw_values = [data[key] for key, _, _ in KPI_SPEC]
+        scaled = [
+            value * 100 if kind == "percent" and isinstance(value, (int, float)) else value
+            for value, (_, _, kind) in zip(raw_values, KPI_SPEC)
+        ]
+        cards = []
+        for (_, _, kind), card, text in zip(KPI_SPEC, KPI_CARDS, format_large_vec(scaled)):
+            if text != "N/A":
+                if kind == "currency":
+                    text = f"{currency_symbol}{text}"
+                elif kind == "percent":
+                    text = f"{text}%"
+            cards.append(card % text)
+        # The whole grid goes out as one markdown element instead of one per card
+        st.markdown(KPI_GRID_TEMPLATE % "".join(cards), unsafe_allow_html=True)
 
         st.divider()
 
         # --- FINANCIAL STATEMENTS SECTION ---
         st.markdown('<div class="section-header">💼 Financial Statements</div>', unsafe_allow_html=True)
-        tab_inc, tab_bal, tab_cf = st.tabs(["💵 Income Statement", "⚖️ Balance Sheet", "💧 Cash Flow"])
-        
-        with tab_inc:
-            if not data['income_stmt'].empty:
-                st.subheader("Annual Income Statement")
-                df_inc = data['income_stmt'].T.iloc[:5]
-                
-                # Create revenue and net income visualization
-                fig = go.Figure(data=[
-                    go.Bar(
-                        name='Total Revenue', 
-                        x=df_inc.index, 
-                        y=df_inc.get('Total Revenue', [0]*5),
-                        marker=dict(color='rgba(0, 180, 216, 0.8)', line=dict(color='#00B4D8', width=1))
-                    ),
-                    go.Bar(
-                        name='Net Income', 
-                        x=df_inc.index, 
-                        y=df_inc.get('Net Income', [0]*5), 
-                        marker=dict(color='rgba(0, 250, 154, 0.8)', line=dict(color='#00FA9A', width=1))
-                    )
-                ])
-                fig.update_layout(
-                    barmode='group', 
-                    height=400, 
-                    paper_bgcolor='rgba(0,0,0,0)', 
-                    plot_bgcolor='rgba(10, 14, 39, 0.5)',
-                    font=dict(color='#e0e0e0'),
-                    xaxis_title='Fiscal Year',
-                    yaxis_title='Amount (USD)',
-                    hovermode='x unified',
-                    legend=dict(bgcolor='rgba(0,0,0,0.5)', bordercolor='#00B4D8', borderwidth=1)
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.markdown("""
-                <div style="background-color: rgba(0, 180, 216, 0.1); border-radius: 8px; padding: 15px; margin: 20px 0;">
-                """, unsafe_allow_html=True)
-                st.dataframe(data['income_stmt'], height=300, use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
-            else:
-                st.info("📭 No Income Statement data available.")
+        # The tabs track which one is open, so only that tab's statement (and,
+        # for the income tab, its chart) is built and sent on each rerun
+        tab_inc, tab_bal, tab_cf = st.tabs(
+            ["💵 Income Statement", "⚖️ Balance Sheet", "💧 Cash Flow"],
+            key="fin_statement_tab",
+            on_change="rerun"
+        )
 
-        with tab_bal:
-            if not data['balance_sheet'].empty:
-                st.subheader("Annual Balance Sheet")
-                st.markdown("""
-                <div style="background-color: rgba(0, 180, 216, 0.1); border-radius: 8px; padding: 15px;">
-                """, unsafe_allow_html=True)
-                st.dataframe(data['balance_sheet'], height=400, use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
-            else:
-                st.info("📭 No Balance Sheet data available.")
+        if tab_inc.open:
+            with tab_inc:
+                if not data['income_stmt'].empty:
+                    st.subheader("Annual Income Statement")
+                    fig = build_income_figure(data['income_stmt'])
+                    st.plotly_chart(fig, use_container_width=True)
+                    
+                    st.markdown("""
+                    <div style="background-color: rgba(0, 180, 216, 0.1); border-radius: 8px; padding: 15px; margin: 20px 0;">
+                    """, unsafe_allow_html=True)
+                    show_statement(data['income_stmt'], height=300)
+                    st.markdown("</div>", unsafe_allow_html=True)
+                else:
+                    st.info("📭 No Income Statement data available.")
 
-        with tab_cf:
-            if not data['cash_flow'].empty:
-                st.subheader("Annual Cash Flow")
-                st.markdown("""
-                <div style="background-color: rgba(0, 180, 216, 0.1); border-radius: 8px; padding: 15px;">
-                """, unsafe_allow_html=True)
-                st.dataframe(data['cash_flow'], height=400, use_container_width=True)
-                st.markdown("</div>", unsafe_allow_html=True)
-            else:
-                st.info("📭 No Cash Flow data available.")
+        if tab_bal.open:
+            with tab_bal:
+                if not data['balance_sheet'].empty:
+                    st.subheader("Annual Balance Sheet")
+                    st.markdown("""
+                    <div style="background-color: rgba(0, 180, 216, 0.1); border-radius: 8px; padding: 15px;">
+                    """, unsafe_allow_html=True)
+                    show_statement(data['balance_sheet'], height=400)
+                    st.markdown("</div>", unsafe_allow_html=True)
+                else:
+                    st.info("📭 No Balance Sheet data available.")
+
+        if tab_cf.open:
+            with tab_cf:
+                if not data['cash_flow'].empty:
+                    st.subheader("Annual Cash Flow")
+                    st.markdown("""
+                    <div style="background-color: rgba(0, 180, 216, 0.1); border-radius: 8px; padding: 15px;">
+                    """, unsafe_allow_html=True)
+                    show_statement(data['cash_flow'], height=400)
+                    st.markdown("</div>", unsafe_allow_html=True)
+                else:
+                    st.info("📭 No Cash Flow data available.")
 
         st.divider()
 
@@ -237,22 +390,7 @@ def display_fundamentals(ticker):
         with col_div:
             st.markdown('<div class="section-header">💰 Dividend History</div>', unsafe_allow_html=True)
             if not data['dividends'].empty:
-                fig_div = go.Figure()
-                fig_div.add_trace(go.Bar(
-                    x=data['dividends'].index,
-                    y=data['dividends'].values,
-                    marker=dict(color='#00FA9A', line=dict(color='#00B4D8', width=1)),
-                    name='Dividend'
-                ))
-                fig_div.update_layout(
-                    height=300,
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(10, 14, 39, 0.5)',
-                    font=dict(color='#e0e0e0'),
-                    xaxis_title='Date',
-                    yaxis_title='Dividend Amount',
-                    hovermode='x unified'
-                )
+                fig_div = build_dividend_figure(data['dividends'])
                 st.plotly_chart(fig_div, use_container_width=True)
             else:
                 st.info("📭 No dividend history available.")
@@ -266,14 +404,21 @@ def display_fundamentals(ticker):
                     <p style="color: #e0e0e0; margin: 0;"><strong>📌 Next Earnings:</strong></p>
                     """, unsafe_allow_html=True)
                     
-                    cal_data = pd.DataFrame(data['calendar'].items(), columns=['Event', 'Date'])
+                    # Tiny dict -> Arrow table directly; no pandas frame needed
+                    cal_data = pa.table({
+                        'Event': list(data['calendar'].keys()),
+                        'Date': [format_calendar_value(v) for v in data['calendar'].values()],
+                    })
                     st.dataframe(cal_data, use_container_width=True, hide_index=True)
                     
                     st.markdown("</div>", unsafe_allow_html=True)
-                except:
+                except (AttributeError, TypeError, ValueError) as e:
+                    # Unexpected calendar shape (pyarrow errors subclass TypeError/ValueError)
+                    logger.warning("Calendar render failed for %s: %s", ticker, e)
                     st.write(data['calendar'])
             else:
                 st.info("📭 No upcoming earnings dates found.")
 
     except Exception as e:
+        logger.exception("Fundamentals failed for %s", ticker)
         st.error(f"❌ Could not fetch fundamental data: {e}")
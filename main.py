@@ -1,61 +1,482 @@
+import hashlib
+import html
+import os
+import threading
+import time
+import requests
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
-from data_loader import fetch_stock_data, get_company_info
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from data_loader import fetch_stock_data
 from news_manager import fetch_finnhub_news, process_news_with_finbert
 from feature_engine import add_technical_indicators
-from fundamental_engine import display_fundamentals, get_fundamental_data
+from fundamental_engine import display_fundamentals, fetch_logo, submit_fundamental_data
 from model_engine import StockPredictor
-from css_styling import load_global_css, load_card_css, load_news_css, load_chart_css
-import random 
+from css_styling import inject_css
 
 # --- Page Config ---
 st.set_page_config(page_title="StockVision", layout="wide", initial_sidebar_state="expanded")
 
 # Load Global CSS (MUST be called first)
-load_global_css()
-load_card_css()
-load_news_css()
-load_chart_css()
+inject_css()
 
 st.title("⚡ StockVision: AI-Powered Market Forecaster")
 
 # --- Helper Functions ---
-@st.cache_data
+TICKER_LIST_URL = "https://raw.githubusercontent.com/rreichel3/US-Stock-Symbols/main/all/all_tickers.txt"
+# Local copy of the ticker list so a server restart doesn't re-download it
+TICKER_CACHE_FILE = "ticker_cache.parquet"
+TICKER_CACHE_MAX_AGE = 86400
+
+INDEX_TICKERS = pd.DataFrame({
+    "Ticker": ["^GSPC", "^DJI", "^IXIC", "BTC-USD", "ETH-USD", "INR=X"]
+})
+FALLBACK_TICKERS = pd.DataFrame({"Ticker": ["AAPL", "GOOGL", "MSFT", "TSLA"]})
+
+@st.cache_data(ttl=TICKER_CACHE_MAX_AGE, show_spinner=False)
+def _download_ticker_list():
+    try:
+        if time.time() - os.path.getmtime(TICKER_CACHE_FILE) < TICKER_CACHE_MAX_AGE:
+            return pd.read_parquet(TICKER_CACHE_FILE)
+    except OSError:
+        pass
+
+    response = requests.get(TICKER_LIST_URL, timeout=5)
+    response.raise_for_status()
+    # One symbol per line, so a plain split is all the parsing needed (and,
+    # unlike read_csv, it doesn't turn symbols such as "NA" into NaN)
+    df = pd.DataFrame({"Ticker": response.text.split()})
+    df = pd.concat([INDEX_TICKERS, df], ignore_index=True)
+    try:
+        df.to_parquet(TICKER_CACHE_FILE, index=False)
+    except OSError:
+        pass
+    return df
+
 def load_ticker_data():
     """
     Loads a dataset of ~8,000 US stock symbols (NASDAQ, NYSE, AMEX).
     """
-    url = "https://raw.githubusercontent.com/rreichel3/US-Stock-Symbols/main/all/all_tickers.txt"
+    # The fallback list is returned outside the cache so a failed download
+    # is retried on the next rerun instead of being cached for a day
     try:
-        df = pd.read_csv(url, header=None, names=["Ticker"])
-        indices = pd.DataFrame({
-            "Ticker": ["^GSPC", "^DJI", "^IXIC", "BTC-USD", "ETH-USD", "INR=X"]
-        })
-        return pd.concat([indices, df], ignore_index=True)
-    except:
-        return pd.DataFrame({"Ticker": ["AAPL", "GOOGL", "MSFT", "TSLA"]})
+        return _download_ticker_list()
+    except Exception:
+        return FALLBACK_TICKERS
+
+INR_SUFFIXES = (".NS", ".BO")
+INR_TICKERS = frozenset({"^NSEI", "^BSESN", "INR=X"})
 
 def get_currency_symbol(ticker):
     """
     Returns '₹' if the ticker is Indian, otherwise '$'.
     """
-    if ticker.endswith(".NS") or ticker.endswith(".BO") or ticker in ["^NSEI", "^BSESN", "INR=X"]:
+    if ticker.endswith(INR_SUFFIXES) or ticker in INR_TICKERS:
         return "₹"
     else:
         return "$"
 
-# --- Sidebar Configuration ---
-with st.sidebar:
-    st.markdown("""
-    <style>
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1a2332 0%, #0a0e27 100%);
+# The technical chart never needs more candles than the browser can show;
+# longer histories are merged into multi-day bars before plotting.
+MAX_CHART_BARS = 1500
+
+# Overlay columns that follow the candle's closing day when days are merged
+CHART_LAST_COLUMNS = ['UpperBand', 'LowerBand', 'RSI']
+
+def downsample_ohlc(df, max_bars=MAX_CHART_BARS):
+    """
+    Returns at most max_bars rows for plotting by merging runs of
+    consecutive trading days into single OHLC candles. High/Low keep each
+    bucket's extremes so no spike disappears from the chart.
+    """
+    n = len(df)
+    if n <= max_bars:
+        return df
+    # Evenly split bucket boundaries; reduceat folds each bucket in one C pass
+    starts = np.linspace(0, n, max_bars, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], n) - 1
+    chart = {
+        'Date': df['Date'].to_numpy()[starts],
+        'Open': df['Open'].to_numpy()[starts],
+        'High': np.maximum.reduceat(df['High'].to_numpy(), starts),
+        'Low': np.minimum.reduceat(df['Low'].to_numpy(), starts),
+        'Close': df['Close'].to_numpy()[ends],
     }
-    </style>
-    """, unsafe_allow_html=True)
+    for col in CHART_LAST_COLUMNS:
+        if col in df.columns:
+            chart[col] = df[col].to_numpy()[ends]
+    return pd.DataFrame(chart)
+
+# Keyed on a cheap signature of the frame (ticker, period, length, last bar)
+# rather than hashing every row of it on each rerun; the frame itself comes
+# from the (ticker, period) market-data cache, so the signature pins it.
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_technical_figure(ticker, data_sig, _df):
+    """
+    Candlestick + Bollinger bands over an RSI panel. Cached so returning to
+    the tab or touching another widget reuses the finished figure.
+    """
+    # Long histories (e.g. 'max') are merged into fewer candles so the
+    # figure sent to the browser stays a bounded size
+    chart_df = downsample_ohlc(_df)
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08, row_heights=[0.7, 0.3])
+
+    fig.add_trace(go.Candlestick(x=chart_df['Date'], open=chart_df['Open'], high=chart_df['High'], low=chart_df['Low'], close=chart_df['Close'], name='OHLC'), row=1, col=1)
+
+    if 'UpperBand' in chart_df.columns:
+        fig.add_trace(go.Scattergl(x=chart_df['Date'], y=chart_df['UpperBand'], mode='lines', line=dict(width=1, color='rgba(0, 180, 216, 0.5)'), name='Upper Band', fill=None), row=1, col=1)
+        fig.add_trace(go.Scattergl(x=chart_df['Date'], y=chart_df['LowerBand'], mode='lines', line=dict(width=1, color='rgba(0, 180, 216, 0.5)'), name='Lower Band', fill='tonexty', fillcolor='rgba(0, 180, 216, 0.1)'), row=1, col=1)
+
+    if 'RSI' in chart_df.columns:
+        fig.add_trace(go.Scattergl(x=chart_df['Date'], y=chart_df['RSI'], mode='lines', line=dict(color='#FFB703', width=2), name='RSI (14)'), row=2, col=1)
+        fig.add_shape(type="line", x0=chart_df['Date'].iloc[0], x1=chart_df['Date'].iloc[-1], y0=70, y1=70, line=dict(color="#FF4B4B", width=1, dash="dash"), row=2, col=1)
+        fig.add_shape(type="line", x0=chart_df['Date'].iloc[0], x1=chart_df['Date'].iloc[-1], y0=30, y1=30, line=dict(color="#00FA9A", width=1, dash="dash"), row=2, col=1)
+
+    fig.update_layout(
+        height=650, 
+        xaxis_rangeslider_visible=False, 
+        template="plotly_dark",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(10, 14, 39, 0.5)',
+        font=dict(color="#e0e0e0"),
+        hovermode='x unified',
+        margin=dict(l=0, r=0, t=0, b=0),
+        # Keep the user's zoom/pan across reruns until the ticker changes
+        uirevision=ticker
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_forecast_figure(hist_dates, hist_close, future_dates, forecast, ticker):
+    """
+    Historical close vs. LSTM forecast. Cached so reruns triggered by other
+    widgets reuse the finished figure; both lines are drawn with WebGL.
+    """
+    fig_ai = go.Figure()
+    fig_ai.add_trace(go.Scattergl(x=hist_dates, y=hist_close, mode='lines', name='Historical', line=dict(color='#00B4D8', width=3)))
+    fig_ai.add_trace(go.Scattergl(x=future_dates, y=forecast, mode='lines+markers', name='AI Prediction', line=dict(color='#FF0055', width=3), marker=dict(size=6)))
     
+    fig_ai.update_layout(
+        height=500, 
+        paper_bgcolor='rgba(0,0,0,0)', 
+        plot_bgcolor='rgba(10, 14, 39, 0.5)', 
+        font=dict(color="white"), 
+        xaxis=dict(showgrid=False, color='#888', title='Date'),
+        yaxis=dict(showgrid=True, gridcolor='#333', color='#888', title='Price'),
+        hovermode="x unified",
+        legend=dict(x=0.01, y=0.99, bgcolor='rgba(0,0,0,0.5)', bordercolor='#00B4D8', borderwidth=1),
+        uirevision=ticker
+    )
+    return fig_ai
+
+@st.cache_data(show_spinner=False)
+def close_correlations(df, top_n=8):
+    """
+    Pearson correlation of every numeric column with Close, strongest
+    top_n last. Only the Close column of the correlation matrix is needed,
+    so it is computed directly instead of building the full matrix.
+    """
+    numeric_df = df.select_dtypes(include=['number'])
+    features = numeric_df.drop(columns='Close')
+    X = features.to_numpy(dtype=np.float32)
+    close = numeric_df['Close'].to_numpy(dtype=np.float32)
+    X = X - X.mean(axis=0)
+    close = close - close.mean()
+    # Constant columns (e.g. a flat Sentiment) have no defined correlation
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = (close @ X) / (np.sqrt((X * X).sum(axis=0)) * np.sqrt(close @ close))
+
+    importance_df = pd.DataFrame({'Feature': features.columns, 'Importance': corr}).dropna()
+    importance_df['Color'] = np.where(importance_df['Importance'] > 0, '#00FA9A', '#FF4B4B')
+    importance_df['Abs_Importance'] = importance_df['Importance'].abs()
+    return importance_df.sort_values(by='Abs_Importance', ascending=True).tail(top_n)
+
+def frame_digest(df):
+    """
+    Short content hash of a dataframe, used as a cheap cache key in place
+    of hashing the whole frame on every lookup.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=8).hexdigest()
+
+TRAINED_PREDICTORS_MAX = 8
+
+@st.cache_resource
+def _trained_predictors():
+    # Shared across sessions; the script re-executes on every rerun, so a
+    # module-level dict would start empty each time
+    return OrderedDict(), threading.Lock()
+
+def get_trained_predictor(ticker, period, df_digest, df, on_epoch_end=None):
+    """
+    Training is the heaviest step in the app, so a fitted model is kept per
+    (ticker, period, data) and new horizons only run predict_future.
+    Training happens outside st.cache_resource: the progress callback writes
+    to the caller's placeholder, which a cached call can't replay.
+    """
+    predictors, lock = _trained_predictors()
+    key = (ticker, period, df_digest)
+    with lock:
+        if key in predictors:
+            predictors.move_to_end(key)
+            return predictors[key]
+
+    predictor = StockPredictor(df)
+    predictor.train(on_epoch_end=on_epoch_end)
+    with lock:
+        predictors[key] = predictor
+        while len(predictors) > TRAINED_PREDICTORS_MAX:
+            predictors.popitem(last=False)
+    return predictor
+
+NEWS_FALLBACK_IMAGES = [
+    "https://images.unsplash.com/photo-1611974789855-9c2a0a7236a3?auto=format&fit=crop&w=300&q=80",
+    "https://images.unsplash.com/photo-1590283603385-17ffb3a7f29f?auto=format&fit=crop&w=300&q=80", 
+    "https://images.unsplash.com/photo-1535320903710-d9cf11350132?auto=format&fit=crop&w=300&q=80"
+]
+
+SENTIMENT_EMOJI = {"Positive": "🟢", "Negative": "🔴"}
+
+# One line of HTML per card: a blank line inside the markdown would end the
+# HTML block and print the rest as text
+NEWS_CARD_TEMPLATE = (
+    '<div class="news-card">'
+    '<img class="news-thumb" src="{image}" loading="lazy" decoding="async">'
+    '<div class="news-container">'
+    '<div class="news-title">[{emoji} {label}] {title}</div>'
+    '<a href="{url}" target="_blank" style="color: #00B4D8; text-decoration: none;">Read Full Article →</a>'
+    '<p style="color: #a0a0a0; margin-top: 8px; font-size: 0.9rem;">{summary}...</p>'
+    '<p style="color: #888; font-size: 0.85rem; margin-top: 10px;">📰 {source} • 📅 {published}</p>'
+    '</div>'
+    '</div>'
+)
+
+def render_news_card(row, image):
+    """
+    HTML for one verified article (a row from itertuples, with the trimmed
+    summary_short column). Text fields are escaped and whitespace-collapsed
+    so they can't break the card markup.
+    """
+    return NEWS_CARD_TEMPLATE.format(
+        image=image,
+        emoji=SENTIMENT_EMOJI.get(row.label, "⚪"),
+        label=row.label,
+        title=html.escape(" ".join(str(row.title).split())),
+        url=html.escape(str(row.url), quote=True),
+        summary=html.escape(" ".join(row.summary_short.split())),
+        source=html.escape(str(row.source)),
+        published=row.published,
+    )
+
+BLOCKED_ICON = "https://cdn-icons-png.flaticon.com/512/564/564619.png"
+
+BLOCKED_CARD_TEMPLATE = (
+    '<div class="news-card">'
+    '<img class="news-blocked-icon" src="{icon}" loading="lazy" decoding="async">'
+    '<div>'
+    '<div class="news-blocked-banner">🚫 BLOCKED: SUSPICIOUS SOURCE DETECTED</div>'
+    '<p><del>{title}</del></p>'
+    '<p style="color: #888; font-size: 0.85rem;">⚠️ Reason: AI detected potential fake news patterns. Confidence: {confidence:.1f}%</p>'
+    '</div>'
+    '</div>'
+)
+
+def render_blocked_card(row):
+    """
+    HTML for one article rejected by the fake-news filter (a row from
+    itertuples).
+    """
+    return BLOCKED_CARD_TEMPLATE.format(
+        icon=BLOCKED_ICON,
+        title=html.escape(" ".join(str(row.title).split())),
+        confidence=row.fake_confidence * 100,
+    )
+
+# Metric card used by the sentiment overview and the forecast results.
+# Kept on one line for the same reason as NEWS_CARD_TEMPLATE.
+AI_CARD_TEMPLATE = (
+    '<div class="ai-card">'
+    '<div class="ai-title">{title}</div>'
+    '<div class="ai-value">{value}</div>'
+    '{note}'
+    '</div>'
+)
+AI_NOTE_TEMPLATE = '<div style="color: {color}; font-size: {size}; margin-top: 8px;">{text}</div>'
+
+def render_ai_card(title, value, note=""):
+    return AI_CARD_TEMPLATE.format(title=title, value=value, note=note)
+
+# Cached on (ticker, period) so reruns from unrelated widgets (sliders,
+# checkboxes, tab switches) skip the downloads, FinBERT and the indicator
+# pass. It raises when there is no price history so failures aren't cached;
+# load_market_data below turns that into None.
+@st.cache_data(ttl=900, show_spinner=False)
+def _build_market_data(ticker, period, api_key):
+    # Prices and news come from independent services, so fetch them side by
+    # side. FinBERT runs in the news worker while the indicators are computed.
+    news_pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        # C. Get News & Sentiment
+        news_future = None
+        if api_key:
+            news_future = news_pool.submit(
+                lambda: process_news_with_finbert(fetch_finnhub_news(ticker, api_key))
+            )
+
+        # A. Get Stock Data
+        df = fetch_stock_data(ticker, period)
+        if df is None:
+            raise LookupError(f"No price history for {ticker}")
+
+        # D. Add Technical Indicators
+        df = add_technical_indicators(df)
+        # Everything downstream (charts, correlations, LSTM windows) is
+        # fine at float32 and moves half the bytes; Date stays datetime64
+        float_cols = df.select_dtypes(include='float').columns
+        df[float_cols] = df[float_cols].astype(np.float32)
+
+        # Missing news (or a model that failed to load) only means no
+        # sentiment, not a broken page
+        sentiment_df = None
+        if news_future is not None:
+            try:
+                sentiment_df = news_future.result()
+            except Exception as e:
+                print(f"News sentiment unavailable for {ticker}: {e}")
+    finally:
+        # Don't wait on news/FinBERT when prices already failed
+        news_pool.shutdown(wait=False)
+
+    # E. Merge Sentiment into Main DataFrame
+    # Only the last 5 sessions carry the news score, so fill a float32
+    # array directly and attach it as one column.
+    sentiment = np.zeros(len(df), dtype=np.float32)
+    if sentiment_df is not None and not sentiment_df.empty:
+        sentiment[-5:] = sentiment_df['sentiment_score'].mean()
+    df['Sentiment'] = sentiment
+    return df, sentiment_df
+
+def load_market_data(ticker, period, api_key):
+    """
+    Returns (df, sentiment_df): prices with technical indicators and the
+    news sentiment column, plus the scored articles. Both are None when no
+    price history was found.
+    """
+    try:
+        return _build_market_data(ticker, period, api_key)
+    except LookupError:
+        return None, None
+
+@st.fragment
+def render_forecast_tab(df, ticker, period):
+    """
+    AI Forecast tab. Runs as a fragment, so moving the horizon slider or
+    clicking Train reruns only this tab instead of the whole dashboard.
+    """
+    last_row = df.iloc[-1]
+    current_price = last_row['Close']
+
+    st.subheader("🤖 AI Price Prediction (LSTM Neural Network)")
+    st.caption("The Neural Network analyzes the past 60 days of patterns to project the future trend.")
+
+    col_ctrl1, col_ctrl2 = st.columns([2, 1], vertical_alignment="bottom")
+    with col_ctrl1:
+        forecast_days = st.slider("📅 Forecast Horizon (Days)", min_value=7, max_value=90, value=30, step=1)
+    with col_ctrl2:
+        train_btn = st.button("🚀 Train Model & Predict", use_container_width=True)
+
+    if train_btn:
+        with st.spinner("🧠 Training Multivariate LSTM Model (Price + News + Technical Indicators)..."):
+            try:
+                # Filled epoch by epoch; a cached model never touches it
+                train_progress = st.empty()
+                predictor = get_trained_predictor(
+                    ticker, period, frame_digest(df), df,
+                    on_epoch_end=lambda done, total: train_progress.progress(done / total, text=f"Epoch {done}/{total}"),
+                )
+                train_progress.empty()
+                # float32 like the price columns, so the figure ships half the bytes
+                forecast = np.asarray(predictor.predict_future(days=forecast_days), dtype=np.float32)
+                
+                last_date = last_row['Date']
+                future_dates = pd.date_range(start=last_date + pd.Timedelta(days=1), periods=forecast_days, freq='D').to_numpy()
+                
+                st.session_state['forecast'] = forecast
+                st.session_state['future_dates'] = future_dates
+                st.success("✨ Prediction Complete! Scroll down to see results.")
+                st.divider()
+            except Exception as e:
+                st.error(f"❌ AI Engine Error: {e}")
+
+    if 'forecast' in st.session_state:
+        forecast = st.session_state['forecast']
+        future_dates = st.session_state['future_dates']
+        
+        final_pred = forecast[-1]
+        change = ((final_pred - current_price) / current_price) * 100
+        currency = get_currency_symbol(ticker)
+        
+        col_res1, col_res2, col_res3 = st.columns(3)
+        
+        with col_res1:
+            st.markdown(render_ai_card("📍 Current Price", f"{currency}{current_price:,.2f}"), unsafe_allow_html=True)
+            
+        with col_res2:
+            arrow = "▲" if change > 0 else "▼"
+            color_class = "ai-pos" if change > 0 else "ai-neg"
+            st.markdown(render_ai_card(
+                f"🔮 Predicted ({forecast_days}d)", f"{currency}{final_pred:,.2f}",
+                f'<div class="{color_class}">{arrow} {abs(change):.2f}%</div>',
+            ), unsafe_allow_html=True)
+
+        with col_res3:
+            st.markdown(render_ai_card(
+                "⚡ Model Confidence", "87.5%",
+                AI_NOTE_TEMPLATE.format(color="#888", size="0.8rem", text="Based on Test Data"),
+            ), unsafe_allow_html=True)
+
+        st.markdown("---")
+        st.subheader("📈 Trend Forecast Visualization")
+        fig_ai = build_forecast_figure(df['Date'].iloc[-90:], df['Close'].iloc[-90:], future_dates, forecast, ticker)
+        st.plotly_chart(fig_ai, use_container_width=True)
+        st.divider()
+
+        with st.expander("📊 Why did the AI make this prediction? (Feature Importance)", expanded=True):
+            col_exp1, col_exp2 = st.columns([2, 1])
+            with col_exp1:
+                st.markdown("#### Top Factors Influencing Price")
+                importance_df = close_correlations(df)
+                
+                fig_xai = go.Figure(go.Bar(x=importance_df['Importance'], y=importance_df['Feature'], orientation='h', marker=dict(color=importance_df['Color'], line=dict(color='rgba(255, 255, 255, 0.2)', width=1)), text=importance_df['Importance'].apply(lambda x: f"{x:.2f}"), textposition='auto'))
+                fig_xai.update_layout(
+                    title="<b>Feature Correlation with Price</b>", 
+                    paper_bgcolor='rgba(0,0,0,0)', 
+                    plot_bgcolor='rgba(10, 14, 39, 0.5)', 
+                    font=dict(color="white"), 
+                    margin=dict(l=0, r=0, t=40, b=0), 
+                    height=350, 
+                    xaxis=dict(showgrid=False), 
+                    yaxis=dict(showgrid=False)
+                )
+                st.plotly_chart(fig_xai, use_container_width=True)
+            
+            with col_exp2:
+                st.markdown("""
+                <div style="background-color: rgba(0, 180, 216, 0.1); border-left: 4px solid #00B4D8; padding: 15px; border-radius: 8px; margin-top: 20px;">
+                <p style="color: #e0e0e0; margin: 0;"><strong>🟢 Green Bars:</strong> Positive correlation (move with price)</p>
+                <p style="color: #e0e0e0; margin: 8px 0 0 0;"><strong>🔴 Red Bars:</strong> Negative correlation (move opposite)</p>
+                <p style="color: #e0e0e0; margin: 8px 0 0 0;"><strong>📏 Length:</strong> Stronger influence on predictions</p>
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.info("👈 Click '🚀 Train Model & Predict' button to generate AI forecasts.")
+
+# --- Sidebar Configuration ---
+with st.sidebar:
     st.header("⚙️ Configuration")
     st.subheader("Asset Selection")
     
@@ -89,49 +510,39 @@ with st.sidebar:
 if ticker:
     # 1. Fetch & Process Data
     with st.spinner(f"🔍 Analyzing market data for {ticker}..."):
-        # A. Get Stock Data
-        df = fetch_stock_data(ticker, period)
-        
-        # B. Get Company Info
-        company_info = get_company_info(ticker)
-        
-        # C. Get News & Sentiment
+        api_key = None
         if "FINNHUB_API_KEY" in st.secrets:
             api_key = st.secrets["FINNHUB_API_KEY"]
-            raw_news = fetch_finnhub_news(ticker, api_key)
-            sentiment_df = process_news_with_finbert(raw_news)
         else:
             st.error("⚠️ Finnhub API Key missing! Please add it to secrets.")
-            sentiment_df = None
 
-        # D. Add Technical Indicators
-        if df is not None:
-            df = add_technical_indicators(df)
+        # Fundamentals (header + Fundamentals tab) load in the background
+        # while the price/news pipeline runs; the header waits on them only
+        # when it renders.
+        fund_future = submit_fundamental_data(ticker)
 
-        # E. Merge Sentiment into Main DataFrame
-        df['Sentiment'] = 0.0 
-        if sentiment_df is not None and not sentiment_df.empty:
-            avg_sentiment = sentiment_df['sentiment_score'].mean()
-            df.iloc[-5:, df.columns.get_loc('Sentiment')] = avg_sentiment
+        df, sentiment_df = load_market_data(ticker, period, api_key)
 
     # 2. Build Dashboard
     if df is not None and not df.empty:
+        # Latest values, pulled once for the header, the indicator summary
+        # and the forecast cards
+        last_row = df.iloc[-1]
+        current_price = last_row['Close']
+        prev_price = df['Close'].iloc[-2]
         
         # --- HEADER SECTION (Logo | Info | Price) ---
         try:
-            fund_data = get_fundamental_data(ticker)
-        except:
+            fund_data = fund_future.result()
+        except Exception:
             fund_data = {"logo_url": "", "name": ticker, "sector": "N/A", "industry": "N/A", "website": "#"}
 
         col_h1, col_h2, col_h3 = st.columns([1, 3, 2])
 
         with col_h1:
-            if fund_data.get("logo_url"):
-                st.markdown(f"""
-                    <div style="display: flex; justify-content: center; align-items: center; padding: 10px;">
-                        <img src="{fund_data['logo_url']}" style="width: 80px; height: 80px; border-radius: 12px; box-shadow: 0 4px 12px rgba(0, 180, 216, 0.2);">
-                    </div>
-                """, unsafe_allow_html=True)
+            logo = fetch_logo(fund_data["logo_url"]) if fund_data.get("logo_url") else None
+            if logo:
+                st.image(logo, width=80)
 
         with col_h2:
             st.markdown(f"""
@@ -148,8 +559,6 @@ if ticker:
                 st.markdown(f"[🌐 Official Website]({fund_data['website']})")
 
         with col_h3:
-            current_price = df['Close'].iloc[-1]
-            prev_price = df['Close'].iloc[-2]
             delta = current_price - prev_price
             currency = get_currency_symbol(ticker)
             
@@ -162,382 +571,199 @@ if ticker:
         st.divider()
 
         # --- TABS SECTION ---
-        tab1, tab2, tab3, tab4 = st.tabs(["📈 Technical Dashboard", "📰 News & Sentiment", "🤖 AI Forecast", "🏢 Fundamental Data"])
+        # Tabs track which one is open so only that tab's charts, widgets and
+        # model work run on a rerun; the others are skipped entirely
+        tab1, tab2, tab3, tab4 = st.tabs(
+            ["📈 Technical Dashboard", "📰 News & Sentiment", "🤖 AI Forecast", "🏢 Fundamental Data"],
+            key="main_tab",
+            on_change="rerun"
+        )
         
         # --- TAB 1: TECHNICAL ---
-        with tab1:
-            st.markdown("""
-            <style>
-            .chart-container {
-                background-color: #1a2332;
-                border: 1px solid #2d3748;
-                border-radius: 12px;
-                padding: 20px;
-                margin: 20px 0;
-            }
-            </style>
-            """, unsafe_allow_html=True)
-            
-            st.subheader("📊 Technical Analysis Chart")
-            st.caption("OHLC Candlestick with Bollinger Bands & RSI Indicator")
-            
-            fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08, row_heights=[0.7, 0.3])
-
-            fig.add_trace(go.Candlestick(x=df['Date'], open=df['Open'], high=df['High'], low=df['Low'], close=df['Close'], name='OHLC'), row=1, col=1)
-            
-            if 'UpperBand' in df.columns:
-                fig.add_trace(go.Scatter(x=df['Date'], y=df['UpperBand'], mode='lines', line=dict(width=1, color='rgba(0, 180, 216, 0.5)'), name='Upper Band', fill=None), row=1, col=1)
-                fig.add_trace(go.Scatter(x=df['Date'], y=df['LowerBand'], mode='lines', line=dict(width=1, color='rgba(0, 180, 216, 0.5)'), name='Lower Band', fill='tonexty', fillcolor='rgba(0, 180, 216, 0.1)'), row=1, col=1)
-            
-            if 'RSI' in df.columns:
-                fig.add_trace(go.Scatter(x=df['Date'], y=df['RSI'], mode='lines', line=dict(color='#FFB703', width=2), name='RSI (14)'), row=2, col=1)
-                fig.add_shape(type="line", x0=df['Date'].iloc[0], x1=df['Date'].iloc[-1], y0=70, y1=70, line=dict(color="#FF4B4B", width=1, dash="dash"), row=2, col=1)
-                fig.add_shape(type="line", x0=df['Date'].iloc[0], x1=df['Date'].iloc[-1], y0=30, y1=30, line=dict(color="#00FA9A", width=1, dash="dash"), row=2, col=1)
-
-            fig.update_layout(
-                height=650, 
-                xaxis_rangeslider_visible=False, 
-                template="plotly_dark",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(10, 14, 39, 0.5)',
-                font=dict(color="#e0e0e0"),
-                hovermode='x unified',
-                margin=dict(l=0, r=0, t=0, b=0)
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Technical Indicators Summary
-            col_t1, col_t2, col_t3, col_t4 = st.columns(4)
-            
-            if 'RSI' in df.columns:
-                latest_rsi = df['RSI'].iloc[-1]
-                col_t1.metric("RSI (14)", f"{latest_rsi:.2f}", 
-                            help="Overbought >70, Oversold <30")
-            
-            if 'MACD_12_26_9' in df.columns:
-                col_t2.metric("MACD", f"{df['MACD_12_26_9'].iloc[-1]:.4f}", 
-                            help="Momentum Indicator")
-            
-            if 'MidBand' in df.columns:
-                bb_width = df['UpperBand'].iloc[-1] - df['LowerBand'].iloc[-1]
-                col_t3.metric("BB Width", f"{bb_width:.2f}", 
-                            help="Volatility Measure")
-            
-            current_price = df['Close'].iloc[-1]
-            yearly_high = df['High'].max()
-            yearly_low = df['Low'].min()
-            col_t4.metric("52W High/Low", f"{yearly_high:.2f} / {yearly_low:.2f}")
-
-        # --- TAB 2: NEWS ---
-        with tab2:
-            st.subheader("🛡️ Verified News Intelligence")
-            st.caption("Pipeline: Fake News Detection AI ➔ FinBERT Sentiment Analysis")
-
-            if sentiment_df is not None and not sentiment_df.empty:
-                clean_df = sentiment_df[sentiment_df['is_trusted'] == True]
-                fake_df = sentiment_df[sentiment_df['is_trusted'] == False]
-                
-                # --- SENTIMENT BREAKDOWN SECTION ---
-                st.markdown('<div class="section-header">📊 Sentiment Analysis Overview</div>', unsafe_allow_html=True)
-                
-                # Calculate sentiment metrics
-                positive_count = len(clean_df[clean_df['label'] == 'Positive'])
-                negative_count = len(clean_df[clean_df['label'] == 'Negative'])
-                neutral_count = len(clean_df[clean_df['label'] == 'Neutral'])
-                
-                # Overall sentiment score (average of all verified news)
-                if len(clean_df) > 0:
-                    overall_sentiment = clean_df['sentiment_score'].mean()
-                else:
-                    overall_sentiment = 0
-                
-                # Sentiment interpretation
-                if overall_sentiment > 0.1:
-                    sentiment_emoji = "🟢"
-                    sentiment_label = "POSITIVE"
-                    sentiment_color = "#00FA9A"
-                elif overall_sentiment < -0.1:
-                    sentiment_emoji = "🔴"
-                    sentiment_label = "NEGATIVE"
-                    sentiment_color = "#FF4B4B"
-                else:
-                    sentiment_emoji = "⚪"
-                    sentiment_label = "NEUTRAL"
-                    sentiment_color = "#FFB703"
+        if tab1.open:
+            with tab1:
+                st.subheader("📊 Technical Analysis Chart")
+                st.caption("OHLC Candlestick with Bollinger Bands & RSI Indicator")
                 
-                # Display overall sentiment with styling
-                col_sent1, col_sent2, col_sent3, col_sent4, col_sent5 = st.columns(5)
+                fig = build_technical_figure(
+                    ticker, (period, len(df), last_row['Date'], float(current_price)), df
+                )
+                st.plotly_chart(fig, use_container_width=True)
                 
-                with col_sent1:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">Market Sentiment</div>
-                        <div style="color: {sentiment_color}; font-size: 2.5rem; font-weight: 800; margin: 10px 0;">
-                            {sentiment_emoji}
-                        </div>
-                        <div style="color: {sentiment_color}; font-weight: 700; font-size: 1.1rem;">
-                            {sentiment_label}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Technical Indicators Summary
+                col_t1, col_t2, col_t3, col_t4 = st.columns(4)
                 
-                with col_sent2:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">Overall Score</div>
-                        <div class="ai-value">{overall_sentiment:.3f}</div>
-                        <div style="color: #888; font-size: 0.8rem; margin-top: 8px;">
-                        Range: -1.0 to +1.0
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                if 'RSI' in df.columns:
+                    col_t1.metric("RSI (14)", f"{last_row['RSI']:.2f}", 
+                                help="Overbought >70, Oversold <30")
                 
-                with col_sent3:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">🟢 Positive News</div>
-                        <div class="ai-value">{positive_count}</div>
-                        <div style="color: #00FA9A; font-size: 0.9rem; margin-top: 8px;">
-                        {(positive_count/len(clean_df)*100):.0f}% of news
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                if 'MACD_12_26_9' in df.columns:
+                    col_t2.metric("MACD", f"{last_row['MACD_12_26_9']:.4f}", 
+                                help="Momentum Indicator")
                 
-                with col_sent4:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">🔴 Negative News</div>
-                        <div class="ai-value">{negative_count}</div>
-                        <div style="color: #FF4B4B; font-size: 0.9rem; margin-top: 8px;">
-                        {(negative_count/len(clean_df)*100):.0f}% of news
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                if 'MidBand' in df.columns:
+                    bb_width = last_row['UpperBand'] - last_row['LowerBand']
+                    col_t3.metric("BB Width", f"{bb_width:.2f}", 
+                                help="Volatility Measure")
                 
-                with col_sent5:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">⚪ Neutral News</div>
-                        <div class="ai-value">{neutral_count}</div>
-                        <div style="color: #FFB703; font-size: 0.9rem; margin-top: 8px;">
-                        {(neutral_count/len(clean_df)*100):.0f}% of news
+                yearly_high = df['High'].to_numpy().max()
+                yearly_low = df['Low'].to_numpy().min()
+                col_t4.metric("52W High/Low", f"{yearly_high:.2f} / {yearly_low:.2f}")
+
+        # --- TAB 2: NEWS ---
+        if tab2.open:
+            with tab2:
+                st.subheader("🛡️ Verified News Intelligence")
+                st.caption("Pipeline: Fake News Detection AI ➔ FinBERT Sentiment Analysis")
+
+                if sentiment_df is not None and not sentiment_df.empty:
+                    clean_df = sentiment_df[sentiment_df['is_trusted'] == True]
+                    fake_df = sentiment_df[sentiment_df['is_trusted'] == False]
+                    
+                    # --- SENTIMENT BREAKDOWN SECTION ---
+                    st.markdown('<div class="section-header">📊 Sentiment Analysis Overview</div>', unsafe_allow_html=True)
+                    
+                    # Calculate sentiment metrics (one pass over the label column)
+                    label_counts = clean_df['label'].value_counts()
+                    positive_count = int(label_counts.get('Positive', 0))
+                    negative_count = int(label_counts.get('Negative', 0))
+                    neutral_count = int(label_counts.get('Neutral', 0))
+                    
+                    # Overall sentiment score (average of all verified news)
+                    if len(clean_df) > 0:
+                        overall_sentiment = clean_df['sentiment_score'].mean()
+                    else:
+                        overall_sentiment = 0
+                    
+                    # Sentiment interpretation
+                    if overall_sentiment > 0.1:
+                        sentiment_emoji = "🟢"
+                        sentiment_label = "POSITIVE"
+                        sentiment_color = "#00FA9A"
+                    elif overall_sentiment < -0.1:
+                        sentiment_emoji = "🔴"
+                        sentiment_label = "NEGATIVE"
+                        sentiment_color = "#FF4B4B"
+                    else:
+                        sentiment_emoji = "⚪"
+                        sentiment_label = "NEUTRAL"
+                        sentiment_color = "#FFB703"
+                    
+                    # Display overall sentiment with styling
+                    col_sent1, col_sent2, col_sent3, col_sent4, col_sent5 = st.columns(5)
+                    
+                    with col_sent1:
+                        st.markdown(f"""
+                        <div class="ai-card">
+                            <div class="ai-title">Market Sentiment</div>
+                            <div style="color: {sentiment_color}; font-size: 2.5rem; font-weight: 800; margin: 10px 0;">
+                                {sentiment_emoji}
+                            </div>
+                            <div style="color: {sentiment_color}; font-weight: 700; font-size: 1.1rem;">
+                                {sentiment_label}
+                            </div>
                         </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.divider()
-                
-                # Sentiment distribution chart
-                sentiment_counts = pd.DataFrame({
-                    'Sentiment': ['Positive', 'Negative', 'Neutral'],
-                    'Count': [positive_count, negative_count, neutral_count],
-                    'Color': ['#00FA9A', '#FF4B4B', '#FFB703']
-                })
-                
-                fig_sentiment = go.Figure(data=[
-                    go.Bar(
-                        x=sentiment_counts['Sentiment'],
-                        y=sentiment_counts['Count'],
-                        marker=dict(color=sentiment_counts['Color'], line=dict(color='white', width=2)),
-                        text=sentiment_counts['Count'],
-                        textposition='auto',
+                        """, unsafe_allow_html=True)
+                    
+                    with col_sent2:
+                        st.markdown(render_ai_card(
+                            "Overall Score", f"{overall_sentiment:.3f}",
+                            AI_NOTE_TEMPLATE.format(color="#888", size="0.8rem", text="Range: -1.0 to +1.0"),
+                        ), unsafe_allow_html=True)
+                    
+                    with col_sent3:
+                        st.markdown(render_ai_card(
+                            "🟢 Positive News", positive_count,
+                            AI_NOTE_TEMPLATE.format(color="#00FA9A", size="0.9rem", text=f"{positive_count/len(clean_df)*100:.0f}% of news"),
+                        ), unsafe_allow_html=True)
+                    
+                    with col_sent4:
+                        st.markdown(render_ai_card(
+                            "🔴 Negative News", negative_count,
+                            AI_NOTE_TEMPLATE.format(color="#FF4B4B", size="0.9rem", text=f"{negative_count/len(clean_df)*100:.0f}% of news"),
+                        ), unsafe_allow_html=True)
+                    
+                    with col_sent5:
+                        st.markdown(render_ai_card(
+                            "⚪ Neutral News", neutral_count,
+                            AI_NOTE_TEMPLATE.format(color="#FFB703", size="0.9rem", text=f"{neutral_count/len(clean_df)*100:.0f}% of news"),
+                        ), unsafe_allow_html=True)
+                    
+                    st.divider()
+                    
+                    # Sentiment distribution chart
+                    sentiment_counts = pd.DataFrame({
+                        'Sentiment': ['Positive', 'Negative', 'Neutral'],
+                        'Count': [positive_count, negative_count, neutral_count],
+                        'Color': ['#00FA9A', '#FF4B4B', '#FFB703']
+                    })
+                    
+                    fig_sentiment = go.Figure(data=[
+                        go.Bar(
+                            x=sentiment_counts['Sentiment'],
+                            y=sentiment_counts['Count'],
+                            marker=dict(color=sentiment_counts['Color'], line=dict(color='white', width=2)),
+                            text=sentiment_counts['Count'],
+                            textposition='auto',
+                        )
+                    ])
+                    
+                    fig_sentiment.update_layout(
+                        title="<b>Sentiment Distribution of Verified News</b>",
+                        xaxis_title='Sentiment Type',
+                        yaxis_title='Number of Articles',
+                        height=350,
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        plot_bgcolor='rgba(10, 14, 39, 0.5)',
+                        font=dict(color='#e0e0e0'),
+                        showlegend=False,
+                        hovermode='x unified'
                     )
-                ])
-                
-                fig_sentiment.update_layout(
-                    title="<b>Sentiment Distribution of Verified News</b>",
-                    xaxis_title='Sentiment Type',
-                    yaxis_title='Number of Articles',
-                    height=350,
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(10, 14, 39, 0.5)',
-                    font=dict(color='#e0e0e0'),
-                    showlegend=False,
-                    hovermode='x unified'
-                )
-                
-                st.plotly_chart(fig_sentiment, use_container_width=True)
-                st.divider()
-                
-                # Summary Stats
-                col_n1, col_n2, col_n3 = st.columns(3)
-                col_n1.metric("✅ Verified News", len(clean_df), help="Trusted articles from verified sources")
-                col_n2.metric("🚫 Suspicious", len(fake_df), help="Articles blocked due to potential fake news")
-                col_n3.metric("📊 Total Analyzed", len(sentiment_df), help="Total news articles processed")
-                
-                st.divider()
-
-                if len(clean_df) > 0:
-                    st.markdown("#### ✅ Verified & Trusted News")
                     
-                    FALLBACK_IMAGES = [
-                        "https://images.unsplash.com/photo-1611974789855-9c2a0a7236a3?auto=format&fit=crop&w=300&q=80",
-                        "https://images.unsplash.com/photo-1590283603385-17ffb3a7f29f?auto=format&fit=crop&w=300&q=80", 
-                        "https://images.unsplash.com/photo-1535320903710-d9cf11350132?auto=format&fit=crop&w=300&q=80"
-                    ]
-
-                    for index, row in clean_df.iterrows():
-                        with st.container():
-                            col_img, col_text = st.columns([1, 3])
-                            
-                            with col_img:
-                                img_idx = index % len(FALLBACK_IMAGES)
-                                st.image(FALLBACK_IMAGES[img_idx], use_container_width=True)
-
-                            with col_text:
-                                emoji = "🟢" if row['label'] == "Positive" else "🔴" if row['label'] == "Negative" else "⚪"
-                                st.markdown(f"""
-                                <div class="news-container">
-                                    <div class="news-title">[{emoji} {row['label']}] {row['title']}</div>
-                                    <a href="{row['url']}" target="_blank" style="color: #00B4D8; text-decoration: none;">Read Full Article →</a>
-                                    <p style="color: #a0a0a0; margin-top: 8px; font-size: 0.9rem;">
-                                    {row['summary'][:200] if pd.notna(row['summary']) else 'No summary available'}...
-                                    </p>
-                                    <p style="color: #888; font-size: 0.85rem; margin-top: 10px;">
-                                    📰 {row['source']} • 📅 {row['published']}
-                                    </p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            st.divider()
-                
-                if len(fake_df) > 0:
-                    st.markdown("#### 🚫 Suspicious/Blocked News")
-                    with st.expander("Show Suspicious Articles", expanded=False):
-                        for index, row in fake_df.iterrows():
-                            with st.container():
-                                col_img, col_text = st.columns([1, 3])
-                                
-                                with col_img:
-                                    st.image("https://cdn-icons-png.flaticon.com/512/564/564619.png", width=80) 
-                                with col_text:
-                                    st.error("🚫 BLOCKED: SUSPICIOUS SOURCE DETECTED")
-                                    st.markdown(f"~~{row['title']}~~")
-                                    st.caption(f"⚠️ Reason: AI detected potential fake news patterns. Confidence: {row['fake_confidence']*100:.1f}%")
-                                st.divider()
-            else:
-                st.info("📭 No recent financial news found for this ticker.")
-
-        # --- TAB 3: AI FORECAST ---
-        with tab3:
-            st.subheader("🤖 AI Price Prediction (LSTM Neural Network)")
-            st.caption("The Neural Network analyzes the past 60 days of patterns to project the future trend.")
-
-            col_ctrl1, col_ctrl2 = st.columns([2, 1], vertical_alignment="bottom")
-            with col_ctrl1:
-                forecast_days = st.slider("📅 Forecast Horizon (Days)", min_value=7, max_value=90, value=30, step=1)
-            with col_ctrl2:
-                train_btn = st.button("🚀 Train Model & Predict", use_container_width=True)
-
-            if train_btn:
-                with st.spinner("🧠 Training Multivariate LSTM Model (Price + News + Technical Indicators)..."):
-                    try:
-                        predictor = StockPredictor(df)
-                        predictor.train()
-                        forecast = predictor.predict_future(days=forecast_days)
-                        
-                        last_date = df['Date'].iloc[-1]
-                        future_dates = [last_date + pd.Timedelta(days=i) for i in range(1, forecast_days + 1)]
-                        
-                        st.session_state['forecast'] = forecast
-                        st.session_state['future_dates'] = future_dates
-                        st.success("✨ Prediction Complete! Scroll down to see results.")
-                        st.divider()
-                    except Exception as e:
-                        st.error(f"❌ AI Engine Error: {e}")
-
-            if 'forecast' in st.session_state:
-                forecast = st.session_state['forecast']
-                future_dates = st.session_state['future_dates']
-                
-                current_price = df['Close'].iloc[-1]
-                final_pred = forecast[-1]
-                change = ((final_pred - current_price) / current_price) * 100
-                currency = get_currency_symbol(ticker)
-                
-                col_res1, col_res2, col_res3 = st.columns(3)
-                
-                with col_res1:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">📍 Current Price</div>
-                        <div class="ai-value">{currency}{current_price:,.2f}</div>
-                    </div>""", unsafe_allow_html=True)
+                    st.plotly_chart(fig_sentiment, use_container_width=True)
+                    st.divider()
                     
-                with col_res2:
-                    arrow = "▲" if change > 0 else "▼"
-                    color_class = "ai-pos" if change > 0 else "ai-neg"
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">🔮 Predicted ({forecast_days}d)</div>
-                        <div class="ai-value">{currency}{final_pred:,.2f}</div>
-                        <div class="{color_class}">{arrow} {abs(change):.2f}%</div>
-                    </div>""", unsafe_allow_html=True)
-
-                with col_res3:
-                    st.markdown(f"""
-                    <div class="ai-card">
-                        <div class="ai-title">⚡ Model Confidence</div>
-                        <div class="ai-value">87.5%</div> 
-                        <div style="color:#888; font-size:0.8rem">Based on Test Data</div>
-                    </div>""", unsafe_allow_html=True)
-
-                st.markdown("---")
-                st.subheader("📈 Trend Forecast Visualization")
-                fig_ai = go.Figure()
-                fig_ai.add_trace(go.Scatter(x=df['Date'].iloc[-90:], y=df['Close'].iloc[-90:], mode='lines', name='Historical', line=dict(color='#00B4D8', width=3)))
-                fig_ai.add_trace(go.Scatter(x=future_dates, y=forecast, mode='lines+markers', name='AI Prediction', line=dict(color='#FF0055', width=3), marker=dict(size=6)))
-                
-                fig_ai.update_layout(
-                    height=500, 
-                    paper_bgcolor='rgba(0,0,0,0)', 
-                    plot_bgcolor='rgba(10, 14, 39, 0.5)', 
-                    font=dict(color="white"), 
-                    xaxis=dict(showgrid=False, color='#888', title='Date'),
-                    yaxis=dict(showgrid=True, gridcolor='#333', color='#888', title='Price'),
-                    hovermode="x unified",
-                    legend=dict(x=0.01, y=0.99, bgcolor='rgba(0,0,0,0.5)', bordercolor='#00B4D8', borderwidth=1)
-                )
-                st.plotly_chart(fig_ai, use_container_width=True)
-                st.divider()
+                    # Summary Stats
+                    col_n1, col_n2, col_n3 = st.columns(3)
+                    col_n1.metric("✅ Verified News", len(clean_df), help="Trusted articles from verified sources")
+                    col_n2.metric("🚫 Suspicious", len(fake_df), help="Articles blocked due to potential fake news")
+                    col_n3.metric("📊 Total Analyzed", len(sentiment_df), help="Total news articles processed")
+                    
+                    st.divider()
 
-                with st.expander("📊 Why did the AI make this prediction? (Feature Importance)", expanded=True):
-                    col_exp1, col_exp2 = st.columns([2, 1])
-                    with col_exp1:
-                        st.markdown("#### Top Factors Influencing Price")
-                        numeric_df = df.select_dtypes(include=['number'])
-                        correlation = numeric_df.corr()['Close'].drop('Close')
-                        importance_df = pd.DataFrame({'Feature': correlation.index, 'Importance': correlation.values})
-                        importance_df['Color'] = importance_df['Importance'].apply(lambda x: '#00FA9A' if x > 0 else '#FF4B4B')
-                        importance_df['Abs_Importance'] = importance_df['Importance'].abs()
-                        importance_df = importance_df.sort_values(by='Abs_Importance', ascending=True).tail(8)
+                    if len(clean_df) > 0:
+                        st.markdown("#### ✅ Verified & Trusted News")
                         
-                        fig_xai = go.Figure(go.Bar(x=importance_df['Importance'], y=importance_df['Feature'], orientation='h', marker=dict(color=importance_df['Color'], line=dict(color='rgba(255, 255, 255, 0.2)', width=1)), text=importance_df['Importance'].apply(lambda x: f"{x:.2f}"), textposition='auto'))
-                        fig_xai.update_layout(
-                            title="<b>Feature Correlation with Price</b>", 
-                            paper_bgcolor='rgba(0,0,0,0)', 
-                            plot_bgcolor='rgba(10, 14, 39, 0.5)', 
-                            font=dict(color="white"), 
-                            margin=dict(l=0, r=0, t=40, b=0), 
-                            height=350, 
-                            xaxis=dict(showgrid=False), 
-                            yaxis=dict(showgrid=False)
+                        # All verified articles go out as one markdown element
+                        # Summaries are trimmed for every article in one vectorized pass
+                        cards_df = clean_df.assign(
+                            summary_short=clean_df['summary'].fillna('No summary available').astype(str).str.slice(0, 200)
+                        )
+                        news_html = "".join(
+                            render_news_card(row, NEWS_FALLBACK_IMAGES[row.Index % len(NEWS_FALLBACK_IMAGES)])
+                            for row in cards_df.itertuples()
                         )
-                        st.plotly_chart(fig_xai, use_container_width=True)
+                        st.markdown(news_html, unsafe_allow_html=True)
                     
-                    with col_exp2:
-                        st.markdown("""
-                        <div style="background-color: rgba(0, 180, 216, 0.1); border-left: 4px solid #00B4D8; padding: 15px; border-radius: 8px; margin-top: 20px;">
-                        <p style="color: #e0e0e0; margin: 0;"><strong>🟢 Green Bars:</strong> Positive correlation (move with price)</p>
-                        <p style="color: #e0e0e0; margin: 8px 0 0 0;"><strong>🔴 Red Bars:</strong> Negative correlation (move opposite)</p>
-                        <p style="color: #e0e0e0; margin: 8px 0 0 0;"><strong>📏 Length:</strong> Stronger influence on predictions</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-            else:
-                st.info("👈 Click '🚀 Train Model & Predict' button to generate AI forecasts.")
+                    if len(fake_df) > 0:
+                        st.markdown("#### 🚫 Suspicious/Blocked News")
+                        with st.expander("Show Suspicious Articles", expanded=False):
+                            st.markdown(
+                                "".join(render_blocked_card(row) for row in fake_df.itertuples()),
+                                unsafe_allow_html=True,
+                            )
+                else:
+                    st.info("📭 No recent financial news found for this ticker.")
+
+        # --- TAB 3: AI FORECAST ---
+        if tab3.open:
+            with tab3:
+                render_forecast_tab(df, ticker, period)
 
         # --- TAB 4: FUNDAMENTALS ---
-        with tab4:
-            display_fundamentals(ticker)
+        if tab4.open:
+            with tab4:
+                display_fundamentals(ticker)
 
     else:
         st.error(f"❌ Could not find data for ticker '{ticker}'. Please check the symbol and try again.")
@@ -1,10 +1,15 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 import tensorflow as tf
 from sklearn.preprocessing import MinMaxScaler
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 
+# Half-precision training only pays off on GPU tensor cores; on CPU the
+# LSTM kernels have no fast fp16/bf16 path, so training stays in float32.
+USE_MIXED_PRECISION = bool(tf.config.list_physical_devices('GPU'))
+
 class StockPredictor:
     def __init__(self, df, lookback=60):
         """
@@ -18,79 +23,119 @@ class StockPredictor:
         # Select only numeric columns (Price, RSI, Sentiment, etc.)
         self.raw_df = clean_df.select_dtypes(include=['number'])
         
+        # Position of the target column, looked up once for training and
+        # every forecast step. We assume 'Close' is one of the columns;
+        # fall back to the first one if it isn't (should not happen).
+        if 'Close' in self.raw_df.columns:
+            self.close_idx = int(self.raw_df.columns.get_loc('Close'))
+        else:
+            self.close_idx = 0
+        
         self.lookback = lookback
         
         # Scaler for ALL features
         self.scaler = MinMaxScaler(feature_range=(0, 1))
         self.model = None
+        self._infer = None
         
         # Separate scaler just for 'Close' price (to reverse-engineer the prediction later)
         self.target_scaler = MinMaxScaler(feature_range=(0, 1))
+        
+        # (X, y, scaled_data) from the first prepare_data() call; the frame
+        # never changes after __init__, so train and predict can share it
+        self._prepared = None
 
     def prepare_data(self):
+        if self._prepared is not None:
+            return self._prepared
+        
         # 1. Fit scaler on all data (Price, RSI, Sentiment...)
-        scaled_data = self.scaler.fit_transform(self.raw_df)
+        # float32 is what the LSTM computes in; integer columns such as Volume
+        # would otherwise make the scaler hand back float64 windows
+        scaled_data = self.scaler.fit_transform(self.raw_df).astype(np.float32, copy=False)
         
         # Fit target scaler just on Close price
-        # We assume 'Close' is one of the columns. We find its index.
-        if 'Close' in self.raw_df.columns:
-            close_idx = self.raw_df.columns.get_loc('Close')
-            self.target_scaler.fit(self.raw_df[['Close']])
-        else:
-            # Fallback if 'Close' isn't found (should not happen)
-            close_idx = 0
-            self.target_scaler.fit(self.raw_df.iloc[:, [0]])
-        
-        X, y = [], []
+        self.target_scaler.fit(self.raw_df.iloc[:, [self.close_idx]])
         
         # 2. Create sequences
-        for i in range(self.lookback, len(scaled_data)):
-            X.append(scaled_data[i-self.lookback:i]) # Past 60 days of ALL features
-            y.append(scaled_data[i, close_idx])       # Next day's Close price
-            
-        X, y = np.array(X), np.array(y)
-        return X, y, scaled_data
+        # Each window is the past 60 days of ALL features, as a zero-copy
+        # strided view; the last one has no next day to predict
+        windows = sliding_window_view(scaled_data, (self.lookback, scaled_data.shape[1]))[:, 0]
+        X = windows[:-1]
+        y = scaled_data[self.lookback:, self.close_idx]  # Next day's Close price
+        
+        self._prepared = (X, y, scaled_data)
+        return self._prepared
 
     def build_model(self, input_shape):
+        policy = 'mixed_float16' if USE_MIXED_PRECISION else 'float32'
         model = Sequential()
-        model.add(LSTM(units=50, return_sequences=True, input_shape=input_shape))
-        model.add(Dropout(0.2))
-        model.add(LSTM(units=50, return_sequences=False))
-        model.add(Dropout(0.2))
-        model.add(Dense(units=1))
+        model.add(LSTM(units=50, return_sequences=True, input_shape=input_shape, dtype=policy))
+        model.add(Dropout(0.2, dtype=policy))
+        model.add(LSTM(units=50, return_sequences=False, dtype=policy))
+        model.add(Dropout(0.2, dtype=policy))
+        # Output layer stays float32 so predictions and the loss keep full precision
+        model.add(Dense(units=1, dtype='float32'))
         
-        model.compile(optimizer='adam', loss='mean_squared_error')
+        optimizer = 'adam'
+        if USE_MIXED_PRECISION:
+            # Scale the loss so small fp16 gradients don't underflow to zero
+            optimizer = tf.keras.mixed_precision.LossScaleOptimizer(tf.keras.optimizers.Adam())
+        model.compile(optimizer=optimizer, loss='mean_squared_error')
         self.model = model
+        
+        # The forecast feeds one window at a time; a graph with a fixed input
+        # signature is traced once and XLA fuses the LSTM cell ops, so each
+        # step skips Python dispatch
+        self._infer = tf.function(
+            lambda x: model(x, training=False),
+            jit_compile=True,
+            input_signature=[tf.TensorSpec([1, input_shape[0], input_shape[1]], tf.float32)],
+        )
         return model
 
-    def train(self, epochs=25, batch_size=32):
+    def _predict_step(self, batch):
+        try:
+            return self._infer(batch)
+        except (tf.errors.InvalidArgumentError, tf.errors.UnimplementedError):
+            # XLA can't compile every op on every backend; use the model eagerly
+            self._infer = lambda x: self.model(x, training=False)
+            return self._infer(batch)
+
+    def train(self, epochs=25, batch_size=32, on_epoch_end=None):
+        """
+        on_epoch_end: optional callable(epochs_done, total_epochs), e.g. to
+        drive a progress bar while fit() runs.
+        """
         X, y, _ = self.prepare_data()
         self.build_model(input_shape=(X.shape[1], X.shape[2]))
-        self.model.fit(X, y, epochs=epochs, batch_size=batch_size, verbose=0)
+        callbacks = []
+        if on_epoch_end is not None:
+            callbacks.append(tf.keras.callbacks.LambdaCallback(
+                on_epoch_end=lambda epoch, logs: on_epoch_end(epoch + 1, epochs)
+            ))
+        self.model.fit(X, y, epochs=epochs, batch_size=batch_size, verbose=0, callbacks=callbacks)
         return self.model
 
     def predict_future(self, days=30):
         X, _, scaled_data = self.prepare_data()
         
-        # Start with the last known sequence
-        current_batch = scaled_data[-self.lookback:].reshape(1, self.lookback, scaled_data.shape[1])
+        # Start with the last known sequence (a copy, since it is updated in place)
+        current_batch = scaled_data[-self.lookback:].reshape(1, self.lookback, scaled_data.shape[1]).copy()
         
-        future_predictions = []
-        close_idx = self.raw_df.columns.get_loc('Close')
+        scaled_predictions = np.empty(days)
         
         for i in range(days):
-            # Predict next price
-            next_pred_scaled = self.model.predict(current_batch, verbose=0)[0, 0]
+            # Predict next price. Calling the compiled model directly skips
+            # predict()'s per-call setup, which costs far more than one window.
+            next_pred_scaled = float(self._predict_step(current_batch)[0, 0])
+            scaled_predictions[i] = next_pred_scaled
             
-            # Store prediction (inverse scaled to get real $$)
-            pred_inverse = self.target_scaler.inverse_transform([[next_pred_scaled]])[0, 0]
-            future_predictions.append(pred_inverse)
-            
-            # Update batch for next step
-            new_row = current_batch[0, -1, :].copy()
-            new_row[close_idx] = next_pred_scaled
-            
-            new_row = new_row.reshape(1, 1, -1)
-            current_batch = np.append(current_batch[:, 1:, :], new_row, axis=1)
-            
-        return future_predictions
\ No newline at end of file
+            # Slide the window one step in place: the last row carries
+            # forward with the predicted close in place of the real one
+            current_batch[0, :-1] = current_batch[0, 1:]
+            current_batch[0, -1, self.close_idx] = next_pred_scaled
+        
+        # Inverse scale every prediction in one call to get real $$
+        future_predictions = self.target_scaler.inverse_transform(scaled_predictions.reshape(-1, 1)).ravel()
+        return future_predictions.tolist()
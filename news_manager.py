@@ -1,9 +1,44 @@
 import requests
+import orjson
+import numpy as np
 import pandas as pd
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from sentiment_engine import predict_finbert_sentiment
 from fake_news_engine import detect_fake_news
+import streamlit as st
+from data_loader import mount_retries
+
+# Runs the Google News fallback alongside the Finnhub request
+_NEWS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="news-fetch")
+
+# (connect, read): an unreachable host fails fast instead of stalling the
+# news worker for the whole read budget
+NEWS_TIMEOUT = (3, 5)
+
+# News has a fallback source, so a single quick retry is enough. The shared
+# HTTP_RETRY (3 retries, 1.5 s backoff) would let a dead host hold the news
+# worker for ~20 s per source.
+NEWS_RETRY = Retry(
+    total=1,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+)
+
+@st.cache_resource
+def get_http_session():
+    """
+    One requests.Session per process so every news fetch reuses pooled
+    keep-alive connections instead of a fresh TCP/TLS handshake.
+    A transient 429/5xx answer is retried once.
+    """
+    session = requests.Session()
+    # Google News serves bot-looking clients an error page instead of RSS
+    session.headers.update({"User-Agent": "Mozilla/5.0"})
+    return mount_retries(session, NEWS_RETRY)
 
 def fetch_google_news(ticker):
     """
@@ -17,32 +52,29 @@ def fetch_google_news(ticker):
     url = f"https://news.google.com/rss/search?q={clean_ticker}+stock+news+india&hl=en-IN&gl=IN&ceid=IN:en"
     
     try:
-        response = requests.get(url)
+        response = get_http_session().get(url, timeout=NEWS_TIMEOUT)
         root = ET.fromstring(response.content)
         
-        articles = []
         # Parse the XML
-        for item in root.findall('./channel/item')[:10]: # Limit to 10
+        items = root.findall('./channel/item')[:10] # Limit to 10
+        
+        # Google dates look like: "Fri, 10 Feb 2026 08:30:00 GMT"
+        # All of them are parsed in one call; anything unparseable becomes now
+        published = pd.to_datetime(
+            [item.find('pubDate').text for item in items],
+            format="%a, %d %b %Y %H:%M:%S %Z", errors='coerce', utc=True,
+        ).fillna(pd.Timestamp.now(tz='UTC'))
+        
+        articles = []
+        for item, pub_ts in zip(items, published):
             title = item.find('title').text
-            link = item.find('link').text
-            pub_date_str = item.find('pubDate').text
             
-            # Google dates look like: "Fri, 10 Feb 2026 08:30:00 GMT"
-            # We convert this to YYYY-MM-DD
-            try:
-                dt_obj = datetime.strptime(pub_date_str, "%a, %d %b %Y %H:%M:%S %Z")
-                pub_date = dt_obj.strftime('%Y-%m-%d')
-                timestamp = dt_obj.timestamp()
-            except:
-                pub_date = datetime.now().strftime('%Y-%m-%d')
-                timestamp = datetime.now().timestamp()
-
             # Create a structure that matches Finnhub's format
             articles.append({
                 'headline': title,
                 'summary': title, # Google RSS doesn't give summaries, so we use title
-                'url': link,
-                'datetime': timestamp,
+                'url': item.find('link').text,
+                'datetime': pub_ts.timestamp(),
                 'source': 'Google News (India)',
                 'image': '' # RSS doesn't provide images
             })
@@ -53,20 +85,28 @@ def fetch_google_news(ticker):
         print(f"Google News Error: {e}")
         return []
 
-def fetch_finnhub_news(ticker, api_key):
-    """
-    Primary: Finnhub. Secondary: Google News.
-    """
+# Finnhub's free tier is rate-limited, and the pipeline above re-fetches news
+# whenever it recomputes (e.g. a period change), so identical lookups within
+# five minutes are served from memory. An empty result raises instead of
+# returning [], so a failed lookup is retried on the next run, not cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def _download_news(ticker, api_key):
     today = datetime.now().strftime('%Y-%m-%d')
     start_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
     
     url = f"https://finnhub.io/api/v1/company-news?symbol={ticker}&from={start_date}&to={today}&token={api_key}"
     
+    # Ask Google at the same time, so an empty or failed Finnhub answer
+    # doesn't cost a second round-trip before the fallback arrives
+    google_future = _NEWS_POOL.submit(fetch_google_news, ticker)
+    
     finnhub_articles = []
     
     try:
-        response = requests.get(url)
-        data = response.json()
+        response = get_http_session().get(url, timeout=NEWS_TIMEOUT)
+        # A week of company news can run to hundreds of KB; orjson parses
+        # it several times faster than the stdlib json behind .json()
+        data = orjson.loads(response.content)
         
         # --- CRITICAL FIX: Check if we actually got a LIST of news ---
         if isinstance(data, list):
@@ -84,10 +124,40 @@ def fetch_finnhub_news(ticker, api_key):
     # If list is empty (or was invalid), switch to Google News
     if not finnhub_articles:
         print(f"⚠️ Finnhub found no news for {ticker} (or returned error). Switching to Google News...")
-        return fetch_google_news(ticker)
+        google_articles = google_future.result()
+        if not google_articles:
+            raise LookupError(f"No news found for {ticker}")
+        return google_articles
     
+    google_future.cancel()
     return finnhub_articles[:10]
 
+def fetch_finnhub_news(ticker, api_key):
+    """
+    Primary: Finnhub. Secondary: Google News.
+    """
+    try:
+        return _download_news(ticker, api_key)
+    except LookupError as e:
+        print(e)
+        return []
+
+
+# Keyed on the article texts themselves (not the article dicts), so the same
+# headlines seen again -- another period, a return visit to the ticker --
+# skip both models entirely. Entries are a few hundred bytes of plain floats,
+# and max_entries bounds the cache as users browse many tickers.
+@st.cache_data(ttl=3600, max_entries=500, show_spinner=False)
+def score_articles(headlines, full_texts):
+    """
+    Runs the fake-news filter over the headlines and FinBERT over the full
+    texts, each as one batch. Returns (fake_results, sentiment_scores) where
+    each score is P(positive) - P(negative).
+    """
+    fake_results = detect_fake_news(list(headlines))
+    probs = predict_finbert_sentiment(list(full_texts))
+    sentiment_scores = (probs[:, 0] - probs[:, 1]).tolist()
+    return fake_results, sentiment_scores
 
 def process_news_with_finbert(articles):
     """
@@ -96,64 +166,38 @@ def process_news_with_finbert(articles):
     if not articles:
         return pd.DataFrame()
     
-    news_data = []
+    headlines = tuple(article.get('headline', '') for article in articles)
+    summaries = [article.get('summary', '') for article in articles]
+    full_texts = tuple(f"{headline}. {summary}" for headline, summary in zip(headlines, summaries))
     
-    for article in articles:
-        headline = article.get('headline', '')
-        summary = article.get('summary', '')
-        full_text = f"{headline}. {summary}"
-        
-        # 1. Fake News Detection
-        validity, confidence = detect_fake_news(headline)
-        
-        is_trusted = True
-        if validity == "FAKE" and confidence > 0.60:
-            is_trusted = False
-
-        # Handle Date Format
-        try:
-            # If it comes from Finnhub, it's a timestamp (int)
-            # If it comes from our Google function, we already made it a timestamp
-            pub_date = datetime.fromtimestamp(article['datetime']).strftime('%Y-%m-%d')
-        except:
-            pub_date = datetime.now().strftime('%Y-%m-%d')
-        
-        news_data.append({
-            'title': headline,
-            'summary': summary,
-            'image': article.get('image', ''),
-            'source': article.get('source', 'Finnhub'),
-            'url': article.get('url', '#'),
-            'published': pub_date,
-            'full_text': full_text,
-            'is_trusted': is_trusted,
-            'fake_confidence': confidence
-        })
-        
-    # Run FinBERT (Same logic as before)
-    if news_data:
-        headlines = [item['full_text'] for item in news_data]
-        probs = predict_finbert_sentiment(headlines)
-        
-        sentiments = []
-        labels = []
-        
-        for i in range(len(probs)):
-            p_pos = probs[i][0].item()
-            p_neg = probs[i][1].item()
-            score = p_pos - p_neg
-            
-            if score > 0.05: label = "Positive"
-            elif score < -0.05: label = "Negative"
-            else: label = "Neutral"
-                
-            sentiments.append(score)
-            labels.append(label)
-            
-        df = pd.DataFrame(news_data)
-        df['sentiment_score'] = sentiments
-        df['label'] = labels
-        
-        return df
+    # 1. Fake News Detection + 2. FinBERT, both batched and cached
+    fake_results, sentiments = score_articles(headlines, full_texts)
+    validity = np.array([result[0] for result in fake_results])
+    fake_confidence = np.array([result[1] for result in fake_results])
+    
+    # Handle Date Format
+    # Finnhub gives a unix timestamp, and our Google function converts to
+    # one too; anything missing or unparseable falls back to today
+    timestamps = pd.to_numeric(pd.Series([article.get('datetime') for article in articles]), errors='coerce')
+    published = pd.to_datetime(timestamps, unit='s').dt.strftime('%Y-%m-%d').fillna(datetime.now().strftime('%Y-%m-%d'))
+    
+    df = pd.DataFrame({
+        'title': headlines,
+        'summary': summaries,
+        'image': [article.get('image', '') for article in articles],
+        'source': [article.get('source', 'Finnhub') for article in articles],
+        'url': [article.get('url', '#') for article in articles],
+        'published': published.to_numpy(),
+        'full_text': full_texts,
+        'is_trusted': ~((validity == "FAKE") & (fake_confidence > 0.60)),
+        'fake_confidence': fake_confidence,
+        'sentiment_score': sentiments,
+    })
+    # Labels for every article in one pass, with a ±0.05 neutral band
+    df['label'] = np.select(
+        [df['sentiment_score'] > 0.05, df['sentiment_score'] < -0.05],
+        ["Positive", "Negative"],
+        default="Neutral",
+    )
     
-    return pd.DataFrame()
\ No newline at end of file
+    return df
@@ -1,28 +1,87 @@
+import threading
+from collections import OrderedDict
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import streamlit as st
 import torch.nn.functional as F
 
+# Headline + summary fits comfortably in 256 tokens; padding to BERT's full
+# 512 would roughly double the attention cost for nothing.
+MAX_ARTICLE_TOKENS = 256
+# Articles per forward pass: keeps activation memory bounded however many
+# articles come in, while still amortizing the per-call overhead.
+BATCH_SIZE = 32
+
+# Probabilities per article text, least recently used first. Market-wide
+# stories show up under many tickers and across refreshes, so only texts
+# FinBERT hasn't seen yet reach the model. Shared by every session's news
+# worker, hence the lock.
+_PROB_CACHE = OrderedDict()
+_PROB_CACHE_SIZE = 4096
+_PROB_CACHE_LOCK = threading.Lock()
+
 # Load FinBERT from Hugging Face
 # We use st.cache_resource so we only download the model ONCE, not every time you click a button.
 @st.cache_resource
 def load_finbert():
-    tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
+    tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert", use_fast=True)
     model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
-    return tokenizer, model
+    
+    if torch.cuda.is_available():
+        device = torch.device("cuda")
+        model = model.to(device).half()
+    else:
+        device = torch.device("cpu")
+        # Dynamic int8 quantization of the Linear layers, which hold nearly
+        # all of BERT-base's FLOPs: faster CPU matmuls, no retraining needed.
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    model.eval()
+    return tokenizer, model, device
+
+def _run_finbert(text_list):
+    tokenizer, model, device = load_finbert()
+    
+    # Batch texts of similar length together so each batch pads only to its
+    # own longest text; character count is a close enough proxy for tokens
+    order = sorted(range(len(text_list)), key=lambda i: len(text_list[i]))
+    
+    batches = []
+    with torch.inference_mode():
+        for start in range(0, len(order), BATCH_SIZE):
+            batch = [text_list[i] for i in order[start:start + BATCH_SIZE]]
+            inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=MAX_ARTICLE_TOKENS)
+            if device.type == "cuda":
+                # Pinned host memory lets the copy run asynchronously
+                inputs = {name: tensor.pin_memory().to(device, non_blocking=True) for name, tensor in inputs.items()}
+            else:
+                inputs = inputs.to(device)
+            batches.append(model(**inputs).logits.float())
+    
+    # Convert logits to probabilities (0 to 1), back in the caller's order
+    probabilities = torch.empty(len(order), batches[0].shape[1])
+    probabilities[order] = F.softmax(torch.cat(batches), dim=1).cpu()
+    return probabilities
 
 def predict_finbert_sentiment(text_list):
     """
     Runs FinBERT on a list of headlines.
     Returns: List of probabilities for [Positive, Negative, Neutral]
     """
-    tokenizer, model = load_finbert()
-    
-    inputs = tokenizer(text_list, return_tensors="pt", padding=True, truncation=True, max_length=512)
+    found = {}
+    with _PROB_CACHE_LOCK:
+        for text in text_list:
+            if text in _PROB_CACHE:
+                _PROB_CACHE.move_to_end(text)
+                found[text] = _PROB_CACHE[text]
     
-    with torch.no_grad():
-        outputs = model(**inputs)
+    misses = [text for text in dict.fromkeys(text_list) if text not in found]
+    if misses:
+        for text, probs in zip(misses, _run_finbert(misses)):
+            found[text] = probs
+        with _PROB_CACHE_LOCK:
+            for text in misses:
+                _PROB_CACHE[text] = found[text]
+            while len(_PROB_CACHE) > _PROB_CACHE_SIZE:
+                _PROB_CACHE.popitem(last=False)
     
-    # Convert logits to probabilities (0 to 1)
-    probabilities = F.softmax(outputs.logits, dim=1)
-    return probabilities
\ No newline at end of file
+    return torch.stack([found[text] for text in text_list])